@@ -0,0 +1,25 @@
+"""
+Benchmark suite for the plugin runtime.
+
+Run with `python -m benchmarks` (or `python main.py bench`).
+"""
+
+from .harness import (
+    benchmark,
+    compare_results,
+    list_benchmarks,
+    load_results,
+    measure,
+    run_benchmarks,
+    save_results,
+)
+
+__all__ = [
+    "benchmark",
+    "compare_results",
+    "list_benchmarks",
+    "load_results",
+    "measure",
+    "run_benchmarks",
+    "save_results",
+]
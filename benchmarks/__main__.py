@@ -0,0 +1,112 @@
+"""
+Command line interface of the benchmark suite.
+
+Usage:
+    python -m benchmarks run [-o results.json] [-k PATTERN] [--quick]
+    python -m benchmarks compare BASELINE.json CURRENT.json [--threshold 0.1]
+    python -m benchmarks list
+"""
+
+import argparse
+import sys
+from typing import List, Optional
+
+from . import suite  # noqa: F401  (registers the benchmarks)
+from .harness import (
+    DEFAULT_THRESHOLD,
+    compare_results,
+    format_time,
+    list_benchmarks,
+    load_results,
+    run_benchmarks,
+    save_results,
+)
+
+
+def _print_result(case: str, result: dict) -> None:
+    line = f"{case:<55} {format_time(result['median']):>12}"
+    if 'items_per_sec' in result:
+        line += f"  {result['items_per_sec']:>14,.0f} items/s"
+    else:
+        line += f"  {result['ops_per_sec']:>14,.0f} ops/s"
+    print(line, flush=True)
+
+
+def _run(args: argparse.Namespace) -> int:
+    repeat, min_time = (3, 0.01) if args.quick else (args.repeat, args.min_time)
+    data = run_benchmarks(args.filter, repeat=repeat, min_time=min_time,
+                          progress=_print_result)
+    if args.output:
+        save_results(data, args.output)
+        print(f"\nResults written to {args.output}")
+
+    if args.baseline:
+        return _report(compare_results(load_results(args.baseline), data, args.threshold),
+                       args.threshold)
+    return 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    rows = compare_results(load_results(args.baseline), load_results(args.current), args.threshold)
+    return _report(rows, args.threshold)
+
+
+def _report(rows: List[dict], threshold: float) -> int:
+    """Print a comparison table; returns 1 if there are regressions"""
+    print(f"\n{'case':<55} {'baseline':>12} {'current':>12} {'change':>8}")
+    for row in rows:
+        marker = {'regression': '  REGRESSION', 'improvement': '  faster'}.get(row['status'], '')
+        print(f"{row['case']:<55} {format_time(row['baseline']):>12} "
+              f"{format_time(row['current']):>12} {row['change']:>+8.1%}{marker}")
+
+    regressions = [row for row in rows if row['status'] == 'regression']
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {threshold:.0%}")
+        return 1
+    print(f"\nNo regressions beyond {threshold:.0%}")
+    return 0
+
+
+def _list(args: argparse.Namespace) -> int:
+    for bench in list_benchmarks():
+        for params in bench.cases():
+            print(bench.case_name(params))
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='benchmarks', description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest='command')
+
+    run = commands.add_parser('run', help='run the benchmarks')
+    run.add_argument('-o', '--output', help='write results to this JSON file')
+    run.add_argument('-k', '--filter', help='only run cases containing this text')
+    run.add_argument('--repeat', type=int, default=5, help='samples per case')
+    run.add_argument('--min-time', type=float, default=0.05,
+                     help='minimum seconds per sample')
+    run.add_argument('--quick', action='store_true', help='fewer, shorter samples')
+    run.add_argument('--baseline', help='compare against this results file')
+    run.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                     help='relative slowdown reported as a regression')
+    run.set_defaults(handler=_run)
+
+    compare = commands.add_parser('compare', help='compare two results files')
+    compare.add_argument('baseline')
+    compare.add_argument('current')
+    compare.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                         help='relative slowdown reported as a regression')
+    compare.set_defaults(handler=_compare)
+
+    listing = commands.add_parser('list', help='list benchmark cases')
+    listing.set_defaults(handler=_list)
+
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if not argv or (argv[0].startswith('-') and argv[0] not in ('-h', '--help')):
+        # Running is the default command
+        argv.insert(0, 'run')
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,222 @@
+"""Benchmark registry, timing, result files and comparison"""
+
+import gc
+import itertools
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+# Relative slowdown of the median above which compare() reports a regression
+DEFAULT_THRESHOLD = 0.10
+
+
+@dataclass
+class Benchmark:
+    """A registered benchmark and the parameter grid it runs over"""
+    name: str
+    factory: Callable[..., Iterator[Callable[[], Any]]]
+    params: Dict[str, List[Any]] = field(default_factory=dict)
+    items: Optional[str] = None
+
+    def cases(self) -> Iterator[Dict[str, Any]]:
+        """Yield one parameter dictionary per combination of the grid"""
+        names = list(self.params)
+        for values in itertools.product(*(self.params[name] for name in names)):
+            yield dict(zip(names, values))
+
+    def case_name(self, params: Dict[str, Any]) -> str:
+        if not params:
+            return self.name
+        args = ','.join(f"{name}={value}" for name, value in params.items())
+        return f"{self.name}[{args}]"
+
+
+_BENCHMARKS: List[Benchmark] = []
+
+
+def benchmark(name: str, items: Optional[str] = None, **params: List[Any]):
+    """
+    Register a benchmark.
+
+    The decorated function is a generator: it performs the setup for one
+    parameter combination, yields the callable to time, and cleans up after
+    the yield.
+
+    Args:
+        name: Benchmark name, e.g. 'hooks.trigger_hook'
+        items: Parameter holding the number of items one call processes,
+            used to report items per second
+        **params: Parameter name -> list of values to run with
+
+    Returns:
+        Decorator
+    """
+    def decorator(func):
+        _BENCHMARKS.append(Benchmark(name, contextmanager(func), params, items))
+        return func
+    return decorator
+
+
+def list_benchmarks() -> List[Benchmark]:
+    """Get all registered benchmarks"""
+    return list(_BENCHMARKS)
+
+
+def measure(func: Callable[[], Any], repeat: int = 5,
+            min_time: float = 0.05) -> Dict[str, Any]:
+    """
+    Time a callable.
+
+    The number of calls per sample is calibrated so that a sample takes at
+    least `min_time` seconds. The garbage collector is disabled while timing.
+
+    Args:
+        func: Callable to time
+        repeat: Number of samples
+        min_time: Minimum duration of one sample in seconds
+
+    Returns:
+        dict: 'number' (calls per sample), 'samples' (seconds per call),
+        'median' and 'min'
+    """
+    timer = time.perf_counter
+
+    def sample(number: int) -> float:
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            start = timer()
+            for _ in range(number):
+                func()
+            return timer() - start
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+    number = 1
+    while True:
+        elapsed = sample(number)
+        if elapsed >= min_time:
+            break
+        number = max(number * 2, int(number * min_time / elapsed) + 1) if elapsed else number * 10
+
+    samples = [sample(number) / number for _ in range(repeat)]
+    return {
+        'number': number,
+        'samples': samples,
+        'median': statistics.median(samples),
+        'min': min(samples)
+    }
+
+
+def run_benchmarks(pattern: Optional[str] = None, repeat: int = 5, min_time: float = 0.05,
+                   progress: Optional[Callable[[str, Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+    """
+    Run the registered benchmarks.
+
+    Args:
+        pattern: Only run cases whose name contains this substring
+        repeat: Samples per case
+        min_time: Minimum duration of one sample in seconds
+        progress: Called with (case name, result) after each case
+
+    Returns:
+        dict: 'meta' (environment) and 'results' (case name -> result)
+    """
+    results = {}
+    for bench in _BENCHMARKS:
+        for params in bench.cases():
+            case = bench.case_name(params)
+            if pattern and pattern not in case:
+                continue
+
+            with bench.factory(**params) as func:
+                result = measure(func, repeat=repeat, min_time=min_time)
+
+            result['params'] = params
+            result['ops_per_sec'] = 1.0 / result['median'] if result['median'] else None
+            if bench.items:
+                result['items_per_sec'] = (
+                    params[bench.items] / result['median'] if result['median'] else None
+                )
+            results[case] = result
+            if progress:
+                progress(case, result)
+
+    return {
+        'meta': {
+            'python': sys.version.split()[0],
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'timestamp': time.time()
+        },
+        'results': results
+    }
+
+
+def save_results(data: Dict[str, Any], path: str) -> None:
+    """Write benchmark results as JSON"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    """Read benchmark results written by save_results()"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any],
+                    threshold: float = DEFAULT_THRESHOLD) -> List[Dict[str, Any]]:
+    """
+    Compare the median time per call of the cases present in both runs.
+
+    Args:
+        baseline: Results of the reference run
+        current: Results of the run to check
+        threshold: Relative slowdown that counts as a regression (0.10 = 10%)
+
+    Returns:
+        List of rows with 'case', 'baseline', 'current', 'change' (relative)
+        and 'status' ('regression', 'improvement' or 'ok')
+    """
+    rows = []
+    base_results = baseline['results']
+    for case, result in current['results'].items():
+        if case not in base_results:
+            continue
+        before = base_results[case]['median']
+        after = result['median']
+        change = after / before - 1.0 if before else 0.0
+
+        if change > threshold:
+            status = 'regression'
+        elif change < -threshold:
+            status = 'improvement'
+        else:
+            status = 'ok'
+
+        rows.append({
+            'case': case,
+            'baseline': before,
+            'current': after,
+            'change': change,
+            'status': status
+        })
+    return rows
+
+
+def format_time(seconds: float) -> str:
+    """Format a duration with a suitable unit"""
+    for unit, scale in (('s', 1.0), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
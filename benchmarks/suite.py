@@ -0,0 +1,205 @@
+"""Benchmarks for the plugin runtime and the example plugins"""
+
+import contextlib
+import os
+import random
+import shutil
+import string
+import tempfile
+from pathlib import Path
+
+from plugin_system import HookManager, Plugin, PluginManager, PluginMetadata
+
+from .harness import benchmark
+
+
+PLUGIN_DIR = str(Path(__file__).resolve().parent.parent / 'plugin_system' / 'plugins')
+
+_SYNTHETIC_PLUGIN = '''
+from plugin_system.core.plugin import Plugin, PluginMetadata
+
+
+class Synthetic{index}Plugin(Plugin):
+    def get_metadata(self):
+        return PluginMetadata(
+            name="Synthetic {index}",
+            version="1.0.0",
+            author="Benchmarks",
+            description="Synthetic plugin used by the benchmarks"
+        )
+
+    def initialize(self, config=None):
+        return True
+
+    def execute(self, *args, **kwargs):
+        return None
+'''
+
+
+class NoopPlugin(Plugin):
+    """Plugin whose execute() does nothing, to measure dispatch overhead"""
+
+    def get_metadata(self) -> PluginMetadata:
+        return PluginMetadata(
+            name="Noop",
+            version="1.0.0",
+            author="Benchmarks",
+            description="Does nothing"
+        )
+
+    def initialize(self, config=None) -> bool:
+        return True
+
+    def execute(self, *args, **kwargs):
+        return None
+
+
+def _words(count: int, seed: int = 0):
+    rng = random.Random(seed)
+    return [''.join(rng.choices(string.ascii_letters, k=8)) for _ in range(count)]
+
+
+def _emails(count: int, seed: int = 0):
+    rng = random.Random(seed)
+    addresses = []
+    for word in _words(count, seed):
+        # Every fourth address is invalid
+        addresses.append(f"{word}@example.com" if rng.random() > 0.25 else f"{word}.example.com")
+    return addresses
+
+
+def _started_manager(plugin_name: str, config=None) -> PluginManager:
+    manager = PluginManager(plugin_dirs=[PLUGIN_DIR])
+    manager.load_plugin(plugin_name)
+    manager.initialize_plugin(plugin_name, config or {})
+    return manager
+
+
+@contextlib.contextmanager
+def _synthetic_plugins(count: int):
+    """Create a temporary directory with a plugins/ root of `count` plugins"""
+    root = tempfile.mkdtemp(prefix='plugin-bench-')
+    try:
+        plugins = os.path.join(root, 'plugins')
+        for index in range(count):
+            plugin_dir = os.path.join(plugins, f"synthetic_{index}")
+            os.makedirs(plugin_dir)
+            with open(os.path.join(plugin_dir, 'plugin.py'), 'w') as f:
+                f.write(_SYNTHETIC_PLUGIN.format(index=index))
+        yield root, plugins
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+@benchmark('manager.discover', plugins=[10, 100])
+def discover(plugins):
+    with _synthetic_plugins(plugins) as (_, plugin_dir):
+        yield lambda: PluginManager(plugin_dirs=[plugin_dir]).discover_plugins()
+
+
+@benchmark('manager.discover_cached', plugins=[10, 100])
+def discover_cached(plugins):
+    with _synthetic_plugins(plugins) as (root, plugin_dir):
+        manifest = os.path.join(root, 'manifest.json')
+        PluginManager(plugin_dirs=[plugin_dir], manifest_path=manifest).discover_plugins()
+        yield lambda: PluginManager(
+            plugin_dirs=[plugin_dir], manifest_path=manifest
+        ).discover_plugins()
+
+
+@benchmark('manager.discover_and_load', plugins=[10, 100])
+def discover_and_load(plugins):
+    with _synthetic_plugins(plugins) as (_, plugin_dir):
+        def run():
+            manager = PluginManager(plugin_dirs=[plugin_dir])
+            for name in manager.discover_plugins():
+                manager.load_plugin(name)
+        yield run
+
+
+@benchmark('manager.execute_plugin')
+def execute_plugin():
+    manager = PluginManager()
+    manager.load_plugin('noop', NoopPlugin)
+    manager.initialize_plugin('noop')
+    yield lambda: manager.execute_plugin('noop', 1, key='value')
+
+
+@benchmark('manager.execute_many', items='size', size=[1000])
+def execute_many(size):
+    manager = PluginManager()
+    manager.load_plugin('noop', NoopPlugin)
+    manager.initialize_plugin('noop')
+    items = list(range(size))
+    yield lambda: manager.execute_many('noop', items)
+
+
+@benchmark('hooks.trigger_hook', callbacks=[1, 10, 100])
+def trigger_hook(callbacks):
+    hooks = HookManager()
+    for index in range(callbacks):
+        hooks.register_hook('event', lambda value, index=index: value + index)
+    yield lambda: hooks.trigger_hook('event', 1)
+
+
+@benchmark('validator.execute_email', items='size', size=[100, 10000])
+def validator_execute(size):
+    manager = _started_manager('example_validator')
+    values = _emails(size)
+    execute = manager.execute_plugin
+    yield lambda: [execute('example_validator', value, 'email') for value in values]
+    manager.unload_plugin('example_validator')
+
+
+@benchmark('validator.validate_bulk_email', items='size', size=[100, 10000])
+def validator_bulk(size):
+    manager = _started_manager('example_validator', {'cache_size': 0})
+    plugin = manager.get_plugin('example_validator')
+    values = _emails(size)
+    yield lambda: plugin.validate_bulk(values, 'email')
+    manager.unload_plugin('example_validator')
+
+
+@benchmark('transformer.uppercase', items='size', size=[100, 10000])
+def transformer_uppercase(size):
+    manager = _started_manager('example_transformer')
+    plugin = manager.get_plugin('example_transformer')
+    words = _words(size)
+    # 'uppercase' works on a single value; stream it over the items
+    yield lambda: list(plugin.stream(words, 'uppercase'))
+    manager.unload_plugin('example_transformer')
+
+
+@benchmark('transformer.sort', items='size', size=[100, 10000])
+def transformer_sort(size):
+    manager = _started_manager('example_transformer')
+    words = _words(size)
+    yield lambda: manager.execute_plugin('example_transformer', words, 'sort')
+    manager.unload_plugin('example_transformer')
+
+
+@benchmark('transformer.to_json', items='size', size=[100, 10000])
+def transformer_to_json(size):
+    manager = _started_manager('example_transformer')
+    records = [{'id': index, 'name': word} for index, word in enumerate(_words(size))]
+    yield lambda: manager.execute_plugin('example_transformer', records, 'to_json', compact=True)
+    manager.unload_plugin('example_transformer')
+
+
+@benchmark('logger.execute', items='size', size=[100, 1000], log_format=['text', 'ndjson'])
+def logger_execute(size, log_format):
+    root = tempfile.mkdtemp(prefix='plugin-bench-')
+    try:
+        # Console output of the logger goes to /dev/null
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stderr(devnull):
+            manager = _started_manager('example_logger', {
+                'log_file': os.path.join(root, 'bench.log'),
+                'log_format': log_format,
+                'buffered': True
+            })
+            execute = manager.execute_plugin
+            yield lambda: [execute('example_logger', 'benchmark message', request_id=index)
+                           for index in range(size)]
+            manager.unload_plugin('example_logger')
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
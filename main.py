@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """
 Demo application showcasing the plugin system.
+
+Run `python main.py bench --help` for the benchmark suite.
 """
 
 import logging
@@ -202,6 +204,11 @@ def demo_plugin_management(manager: PluginManager):
 
 def main():
     """Main demo application"""
+    if sys.argv[1:2] == ['bench']:
+        # python main.py bench [run|compare|list] ...
+        from benchmarks.__main__ import main as bench_main
+        return bench_main(sys.argv[2:])
+
     print("="*60)
     print("Plugin System Demo Application")
     print("="*60)
@@ -5,6 +5,8 @@ Plugin System - A flexible and extensible plugin architecture
 from .core.plugin import Plugin, PluginMetadata
 from .core.manager import PluginManager
 from .core.hooks import HookManager
+from .core.metrics import MetricsRegistry
+from .core.forkserver import ForkServer
 
 __version__ = "1.0.0"
-__all__ = ["Plugin", "PluginMetadata", "PluginManager", "HookManager"]
+__all__ = ["Plugin", "PluginMetadata", "PluginManager", "HookManager", "MetricsRegistry", "ForkServer"]
@@ -3,5 +3,7 @@
 from .plugin import Plugin, PluginMetadata
 from .manager import PluginManager
 from .hooks import HookManager
+from .metrics import MetricsRegistry
+from .forkserver import ForkServer
 
-__all__ = ["Plugin", "PluginMetadata", "PluginManager", "HookManager"]
+__all__ = ["Plugin", "PluginMetadata", "PluginManager", "HookManager", "MetricsRegistry", "ForkServer"]
@@ -0,0 +1,45 @@
+"""Dependency resolution for plugins"""
+
+from typing import Dict, List
+
+
+def resolve_dependency_levels(dependencies: Dict[str, List[str]]) -> List[List[str]]:
+    """
+    Group plugins into levels that can be processed concurrently.
+
+    Every plugin is placed in the first level after all of its dependencies.
+    Dependencies that are not keys of the mapping are ignored here; callers
+    decide whether such external dependencies are satisfied.
+
+    Args:
+        dependencies: Mapping of plugin name to the names it depends on
+
+    Returns:
+        List of levels, each a list of plugin names in input order
+
+    Raises:
+        ValueError: If the dependencies contain a cycle
+    """
+    remaining = {
+        name: {dep for dep in deps if dep in dependencies and dep != name}
+        for name, deps in dependencies.items()
+    }
+    for name, deps in dependencies.items():
+        if name in deps:
+            raise ValueError(f"Plugin depends on itself: {name}")
+
+    levels = []
+    while remaining:
+        level = [name for name, deps in remaining.items() if not deps]
+        if not level:
+            cycle = ", ".join(sorted(remaining))
+            raise ValueError(f"Circular plugin dependencies involving: {cycle}")
+
+        levels.append(level)
+        for name in level:
+            del remaining[name]
+        done = set(level)
+        for deps in remaining.values():
+            deps -= done
+
+    return levels
@@ -0,0 +1,198 @@
+"""Fork server that preloads plugins once and forks workers from it"""
+
+import gc
+import logging
+import os
+import signal
+import sys
+import traceback
+from typing import Any, Callable, Dict, List, Optional
+
+from .lazy import LazyPlugin
+from .manager import PluginManager
+
+
+class ForkServer:
+    """
+    Preloads plugins in the current process and forks workers on demand.
+
+    preload() imports (and optionally initializes) the plugins once and
+    freezes the garbage collector generations, so the loaded code and
+    metadata are shared copy-on-write with every forked worker instead of
+    being rebuilt per worker. In each worker, PluginManager.after_fork()
+    gives plugins a chance to reopen per-process resources before the
+    worker function runs.
+
+    Requires os.fork() (POSIX).
+    """
+
+    def __init__(self, manager: PluginManager):
+        """
+        Initialize the fork server.
+
+        Args:
+            manager: Plugin manager whose plugins are preloaded
+        """
+        if not hasattr(os, 'fork'):
+            raise RuntimeError("ForkServer requires os.fork()")
+
+        self.logger = logging.getLogger(__name__)
+        self.manager = manager
+        self._workers: Dict[int, Callable[[PluginManager], Any]] = {}
+
+    def preload(self, plugin_names: Optional[List[str]] = None,
+                configs: Optional[Dict[str, Dict[str, Any]]] = None,
+                initialize: bool = True) -> Dict[str, bool]:
+        """
+        Import, and optionally initialize, plugins before forking.
+
+        Lazy plugin proxies are imported as well, so workers never import
+        plugin modules themselves.
+
+        Args:
+            plugin_names: Plugins to load, or None for all discovered plugins
+            configs: Optional mapping of plugin name to configuration
+            initialize: Initialize the plugins in the server process
+
+        Returns:
+            Mapping of plugin name to whether it was preloaded successfully
+        """
+        results = self.manager.load_all(plugin_names)
+
+        for plugin_name, loaded in results.items():
+            if loaded and isinstance(self.manager.get_plugin(plugin_name), LazyPlugin):
+                try:
+                    self.manager._materialize_plugin(plugin_name)
+                except Exception as e:
+                    self.logger.error(f"Failed to import {plugin_name}: {e}")
+                    results[plugin_name] = False
+
+        if initialize:
+            initialized = self.manager.initialize_all(configs)
+            for plugin_name in results:
+                results[plugin_name] = results[plugin_name] and initialized.get(plugin_name, False)
+
+        # Move everything loaded so far out of the collector's reach, so
+        # collections in the workers do not touch (and copy) shared pages
+        gc.collect()
+        gc.freeze()
+
+        self.logger.info(f"Preloaded {sum(results.values())} plugins")
+        return results
+
+    def fork(self, target: Callable[[PluginManager], Any]) -> int:
+        """
+        Fork a worker that runs target(manager).
+
+        The worker exits with target's return value if it is an int, 0
+        otherwise, or 1 if target raises. Before exiting, the worker unloads
+        its plugins and shuts down logging, so buffered records are written.
+
+        Args:
+            target: Worker function receiving the preloaded PluginManager
+
+        Returns:
+            int: Process id of the worker
+        """
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 1
+            try:
+                self._workers.clear()
+                self.manager.after_fork()
+                result = target(self.manager)
+                exit_code = result if isinstance(result, int) else 0
+            except BaseException:
+                traceback.print_exc()
+            finally:
+                self._shutdown_worker()
+                os._exit(exit_code)
+
+        self._workers[pid] = target
+        self.logger.debug(f"Forked worker: {pid}")
+        return pid
+
+    def _shutdown_worker(self) -> None:
+        """Shut down the plugins and flush logging in a worker about to exit"""
+        for plugin_name in reversed(self.manager.list_plugins()):
+            try:
+                self.manager.unload_plugin(plugin_name)
+            except Exception:
+                traceback.print_exc()
+        try:
+            logging.shutdown()
+        except Exception:
+            traceback.print_exc()
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+    def maintain(self, count: int, target: Callable[[PluginManager], Any]) -> List[int]:
+        """
+        Reap exited workers and fork new ones until `count` are running.
+
+        Args:
+            count: Number of workers to keep running
+            target: Worker function for new workers
+
+        Returns:
+            List of process ids of newly forked workers
+        """
+        self.reap()
+        return [self.fork(target) for _ in range(count - len(self._workers))]
+
+    def reap(self) -> Dict[int, int]:
+        """
+        Collect workers that have exited, without blocking.
+
+        Returns:
+            Mapping of process id to exit code of the exited workers
+        """
+        exited = {}
+        for pid in list(self._workers):
+            try:
+                waited, status = os.waitpid(pid, os.WNOHANG)
+            except ChildProcessError:
+                waited, status = pid, 0
+            if waited:
+                exited[pid] = os.waitstatus_to_exitcode(status)
+                del self._workers[pid]
+        return exited
+
+    def wait(self) -> Dict[int, int]:
+        """
+        Wait for all workers to exit.
+
+        Returns:
+            Mapping of process id to exit code
+        """
+        exited = {}
+        for pid in list(self._workers):
+            try:
+                _, status = os.waitpid(pid, 0)
+                exited[pid] = os.waitstatus_to_exitcode(status)
+            except ChildProcessError:
+                exited[pid] = 0
+            del self._workers[pid]
+        return exited
+
+    def stop(self, sig: int = signal.SIGTERM) -> Dict[int, int]:
+        """
+        Signal all workers and wait for them to exit.
+
+        Args:
+            sig: Signal to send
+
+        Returns:
+            Mapping of process id to exit code
+        """
+        for pid in self._workers:
+            try:
+                os.kill(pid, sig)
+            except ProcessLookupError:
+                pass
+        return self.wait()
+
+    @property
+    def workers(self) -> List[int]:
+        """Process ids of the running workers"""
+        return list(self._workers)
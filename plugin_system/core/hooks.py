@@ -1,28 +1,79 @@
 """Hook system for plugin event handling"""
 
 from collections import defaultdict
-from typing import Any, Callable, Dict, List
+from concurrent.futures import Executor
+from functools import partial
+from itertools import count
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import asyncio
+import inspect
 import logging
 
+from .metrics import MetricsRegistry
+
+
+_FAILED = object()
+
 
 class HookManager:
     """
     Manages hooks that plugins can register to respond to events.
+
+    Callbacks are kept per hook together with a priority. On every
+    register/unregister the hook is compiled into an immutable tuple of
+    callbacks ordered by priority, so triggering a hook only has to walk
+    that tuple.
     """
 
-    def __init__(self):
+    def __init__(self, async_timeout: Optional[float] = None,
+                 offload_sync: bool = False, executor: Optional[Executor] = None,
+                 metrics: Optional[MetricsRegistry] = None):
+        """
+        Initialize the hook manager.
+
+        Args:
+            async_timeout: Per-callback timeout in seconds for async_trigger_hook
+            offload_sync: Run plain callbacks in an executor in async_trigger_hook
+            executor: Executor for offloaded callbacks (default: the loop's executor)
+            metrics: Registry that records trigger_hook calls per hook name
+                (None disables metrics)
+        """
         self.logger = logging.getLogger(__name__)
-        self._hooks: Dict[str, List[Callable]] = defaultdict(list)
+        self.async_timeout = async_timeout
+        self.offload_sync = offload_sync
+        self.executor = executor
+        self.metrics = metrics
+        self._hooks: Dict[str, List[Tuple[int, int, Callable]]] = defaultdict(list)
+        self._dispatch: Dict[str, Tuple[Callable, ...]] = {}
+        self._async_dispatch: Dict[str, Tuple[Tuple[Callable, bool], ...]] = {}
+        self._sequence = count()
+
+    def _compile(self, hook_name: str) -> None:
+        """Rebuild the dispatch tuples of a hook (highest priority first)"""
+        entries = sorted(self._hooks.get(hook_name, ()), key=lambda e: (-e[0], e[1]))
+        if entries:
+            callbacks = tuple(callback for _, _, callback in entries)
+            self._dispatch[hook_name] = callbacks
+            self._async_dispatch[hook_name] = tuple(
+                (callback, inspect.iscoroutinefunction(callback)) for callback in callbacks
+            )
+        else:
+            self._dispatch.pop(hook_name, None)
+            self._async_dispatch.pop(hook_name, None)
 
-    def register_hook(self, hook_name: str, callback: Callable) -> None:
+    def register_hook(self, hook_name: str, callback: Callable, priority: int = 0) -> None:
         """
         Register a callback for a specific hook.
 
         Args:
             hook_name: Name of the hook
             callback: Function to call when hook is triggered
+            priority: Callbacks with higher priority run first; callbacks with
+                equal priority run in registration order
         """
-        self._hooks[hook_name].append(callback)
+        self._hooks[hook_name].append((priority, next(self._sequence), callback))
+        self._compile(hook_name)
         self.logger.debug(f"Registered hook: {hook_name}")
 
     def unregister_hook(self, hook_name: str, callback: Callable) -> bool:
@@ -36,10 +87,16 @@ class HookManager:
         Returns:
             bool: True if callback was found and removed
         """
-        if hook_name in self._hooks and callback in self._hooks[hook_name]:
-            self._hooks[hook_name].remove(callback)
-            self.logger.debug(f"Unregistered hook: {hook_name}")
-            return True
+        entries = self._hooks.get(hook_name)
+        if not entries:
+            return False
+
+        for index, (_, _, registered) in enumerate(entries):
+            if registered == callback:
+                del entries[index]
+                self._compile(hook_name)
+                self.logger.debug(f"Unregistered hook: {hook_name}")
+                return True
         return False
 
     def trigger_hook(self, hook_name: str, *args, **kwargs) -> List[Any]:
@@ -54,19 +111,115 @@ class HookManager:
         Returns:
             List of results from all callbacks
         """
-        results = []
+        callbacks = self._dispatch.get(hook_name)
+        if not callbacks:
+            return []
 
-        if hook_name in self._hooks:
+        if self.logger.isEnabledFor(logging.DEBUG):
             self.logger.debug(f"Triggering hook: {hook_name}")
-            for callback in self._hooks[hook_name]:
-                try:
-                    result = callback(*args, **kwargs)
-                    results.append(result)
-                except Exception as e:
-                    self.logger.error(f"Error in hook {hook_name}: {e}")
 
+        metrics = self.metrics
+        if metrics is not None:
+            series = metrics.begin('hook', hook_name)
+            started = perf_counter()
+
+        results = []
+        append = results.append
+        errors = 0
+        # A failing callback only interrupts the inner loop; the shared
+        # iterator resumes with the next callback.
+        remaining = iter(callbacks)
+        while True:
+            try:
+                for callback in remaining:
+                    append(callback(*args, **kwargs))
+                break
+            except Exception as e:
+                errors += 1
+                self.logger.error(f"Error in hook {hook_name}: {e}")
+
+        if metrics is not None:
+            series.end(perf_counter() - started, errors)
         return results
 
+    def fire_and_forget(self, hook_name: str, *args, **kwargs) -> None:
+        """
+        Trigger all callbacks registered to a hook without collecting results.
+
+        Args:
+            hook_name: Name of the hook to trigger
+            *args: Positional arguments to pass to callbacks
+            **kwargs: Keyword arguments to pass to callbacks
+        """
+        callbacks = self._dispatch.get(hook_name)
+        if not callbacks:
+            return
+
+        remaining = iter(callbacks)
+        while True:
+            try:
+                for callback in remaining:
+                    callback(*args, **kwargs)
+                return
+            except Exception as e:
+                self.logger.error(f"Error in hook {hook_name}: {e}")
+
+    async def async_trigger_hook(self, hook_name: str, *args, **kwargs) -> List[Any]:
+        """
+        Trigger all callbacks registered to a hook from asyncio code.
+
+        Coroutine callbacks run concurrently. Plain callbacks run inline, or in
+        the executor when offload_sync is set. Each callback is bounded by
+        async_timeout; failing or timed out callbacks are logged and left out
+        of the results, like in trigger_hook.
+
+        Args:
+            hook_name: Name of the hook to trigger
+            *args: Positional arguments to pass to callbacks
+            **kwargs: Keyword arguments to pass to callbacks
+
+        Returns:
+            List of results from all callbacks, in dispatch order
+        """
+        callbacks = self._async_dispatch.get(hook_name)
+        if not callbacks:
+            return []
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Triggering async hook: {hook_name}")
+
+        loop = asyncio.get_running_loop()
+        outcomes = await asyncio.gather(*[
+            self._run_async_callback(loop, hook_name, callback, is_coroutine, args, kwargs)
+            for callback, is_coroutine in callbacks
+        ])
+        return [outcome for outcome in outcomes if outcome is not _FAILED]
+
+    async def _run_async_callback(self, loop: asyncio.AbstractEventLoop, hook_name: str,
+                                  callback: Callable, is_coroutine: bool,
+                                  args: tuple, kwargs: dict) -> Any:
+        """Run one callback for async_trigger_hook, returning _FAILED on error"""
+        try:
+            if is_coroutine:
+                awaitable = callback(*args, **kwargs)
+            elif self.offload_sync:
+                awaitable = loop.run_in_executor(self.executor, partial(callback, *args, **kwargs))
+            else:
+                result = callback(*args, **kwargs)
+                if not inspect.isawaitable(result):
+                    return result
+                awaitable = result
+
+            if self.async_timeout is None:
+                return await awaitable
+            return await asyncio.wait_for(awaitable, self.async_timeout)
+
+        except asyncio.TimeoutError:
+            self.logger.error(f"Timeout in hook {hook_name} after {self.async_timeout}s")
+        except Exception as e:
+            self.logger.error(f"Error in hook {hook_name}: {e}")
+        return _FAILED
+
     def clear_hooks(self, hook_name: str = None) -> None:
         """
         Clear hooks.
@@ -77,8 +230,12 @@ class HookManager:
         if hook_name:
             if hook_name in self._hooks:
                 del self._hooks[hook_name]
+                self._dispatch.pop(hook_name, None)
+                self._async_dispatch.pop(hook_name, None)
         else:
             self._hooks.clear()
+            self._dispatch.clear()
+            self._async_dispatch.clear()
 
     def list_hooks(self) -> List[str]:
         """List all registered hook names"""
@@ -0,0 +1,420 @@
+"""Process-isolated plugin execution"""
+
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+from multiprocessing import shared_memory
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .plugin import Plugin, PluginMetadata
+
+
+# Plugin methods a worker process will run on behalf of the host
+WORKER_METHODS = ('execute', 'execute_batch')
+
+# Buffers at least this large cross the process boundary via shared memory
+DEFAULT_SHM_THRESHOLD = 1024 * 1024
+
+# Seconds a caller waits for an idle worker before re-checking the pool
+IDLE_POLL_INTERVAL = 0.1
+
+
+class SharedBuffer:
+    """
+    Picklable handle for a bytes-like value parked in shared memory.
+
+    Only the segment name and size are sent through the pipe. The receiving
+    side copies the data out and unlinks the segment.
+    """
+
+    __slots__ = ('name', 'size', 'kind')
+
+    def __init__(self, name: str, size: int, kind: str):
+        self.name = name
+        self.size = size
+        self.kind = kind
+
+
+def _pack(value: Any, threshold: int) -> Any:
+    """Move a large bytes-like value into shared memory"""
+    if threshold <= 0 or not isinstance(value, (bytes, bytearray, memoryview)):
+        return value
+
+    data = memoryview(value).cast('B')
+    if data.nbytes < threshold:
+        return value
+
+    segment = shared_memory.SharedMemory(create=True, size=data.nbytes)
+    try:
+        segment.buf[:data.nbytes] = data
+    finally:
+        segment.close()
+    kind = 'bytearray' if isinstance(value, bytearray) else 'bytes'
+    return SharedBuffer(segment.name, data.nbytes, kind)
+
+
+def _unpack(value: Any) -> Any:
+    """Copy a SharedBuffer out of shared memory and release the segment"""
+    if not isinstance(value, SharedBuffer):
+        return value
+
+    segment = shared_memory.SharedMemory(name=value.name)
+    try:
+        data = segment.buf[:value.size]
+        result = bytearray(data) if value.kind == 'bytearray' else bytes(data)
+        data.release()
+    finally:
+        segment.close()
+        segment.unlink()
+    return result
+
+
+def _discard(buffer: SharedBuffer) -> None:
+    """Unlink a shared memory segment if it still exists"""
+    try:
+        segment = shared_memory.SharedMemory(name=buffer.name)
+    except FileNotFoundError:
+        return
+    segment.close()
+    segment.unlink()
+
+
+def _pack_call(args: Tuple, kwargs: Dict[str, Any], threshold: int) -> Tuple[Tuple, Dict[str, Any]]:
+    return (
+        tuple(_pack(arg, threshold) for arg in args),
+        {key: _pack(value, threshold) for key, value in kwargs.items()}
+    )
+
+
+def _unpack_call(args: Tuple, kwargs: Dict[str, Any]) -> Tuple[Tuple, Dict[str, Any]]:
+    return (
+        tuple(_unpack(arg) for arg in args),
+        {key: _unpack(value) for key, value in kwargs.items()}
+    )
+
+
+def _worker_main(conn, plugin_dirs: List[str], plugin_name: str,
+                 config: Dict[str, Any], threshold: int) -> None:
+    """
+    Entry point of a worker process.
+
+    Loads and initializes the plugin through a PluginManager of its own, then
+    serves (method, args, kwargs) requests until it receives None.
+    """
+    from .manager import PluginManager
+
+    manager = PluginManager(plugin_dirs)
+    if not manager.load_plugin(plugin_name) or not manager.initialize_plugin(plugin_name, config):
+        conn.send((False, RuntimeError(f"Could not start plugin in worker: {plugin_name}")))
+        return
+
+    plugin = manager.get_plugin(plugin_name)
+    conn.send((True, plugin.get_metadata()))
+
+    try:
+        while True:
+            try:
+                request = conn.recv()
+            except EOFError:
+                break
+            if request is None:
+                break
+
+            method, args, kwargs = request
+            try:
+                args, kwargs = _unpack_call(args, kwargs)
+                reply = (True, _pack(getattr(plugin, method)(*args, **kwargs), threshold))
+            except Exception as e:
+                reply = (False, e)
+
+            try:
+                conn.send(reply)
+            except Exception as e:
+                # Result or exception could not be pickled
+                conn.send((False, RuntimeError(f"{type(e).__name__}: {e}")))
+    finally:
+        manager.unload_plugin(plugin_name)
+
+
+class _Worker:
+    """A single worker process and the host end of its pipe"""
+
+    def __init__(self, pool: 'PluginProcessPool'):
+        self.pool = pool
+        self.process = None
+        self.conn = None
+
+    def start(self) -> PluginMetadata:
+        pool = self.pool
+        conn, child_conn = pool.context.Pipe()
+        process = pool.context.Process(
+            target=_worker_main,
+            args=(child_conn, pool.plugin_dirs, pool.plugin_name, pool.config, pool.shm_threshold),
+            name=f"PluginWorker-{pool.plugin_name}",
+            daemon=True
+        )
+        process.start()
+        child_conn.close()
+        self.process, self.conn = process, conn
+
+        try:
+            ok, payload = conn.recv()
+        except EOFError:
+            ok, payload = False, RuntimeError(
+                f"Worker for {pool.plugin_name} exited during startup"
+            )
+        if not ok:
+            self.stop()
+            raise payload
+        return payload
+
+    def call(self, method: str, args: Tuple, kwargs: Dict[str, Any],
+             timeout: Optional[float]) -> Tuple[bool, Any]:
+        """Send a request and wait for (ok, result or exception)"""
+        self.conn.send((method, args, kwargs))
+        if timeout is not None and not self.conn.poll(timeout):
+            raise TimeoutError(
+                f"Plugin {self.pool.plugin_name} did not answer within {timeout}s"
+            )
+        return self.conn.recv()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        # A caller whose call fails may kill() the worker concurrently
+        conn, process = self.conn, self.process
+        if conn is not None:
+            try:
+                conn.send(None)
+            except (OSError, ValueError):
+                pass
+        if process is not None:
+            process.join(timeout)
+            if process.is_alive():
+                process.kill()
+                process.join()
+        self.kill()
+
+    def kill(self) -> None:
+        conn, process = self.conn, self.process
+        self.process = None
+        self.conn = None
+        if process is not None and process.is_alive():
+            process.kill()
+            process.join()
+        if conn is not None:
+            conn.close()
+
+
+class PluginProcessPool:
+    """
+    Pool of worker processes that each host one instance of a plugin.
+
+    Every worker loads and initializes the plugin once, through the same
+    discovery/import path as the host. Calls are dispatched to an idle
+    worker, so concurrent callers run in parallel across cores. Large
+    bytes-like arguments and results are passed through shared memory.
+
+    A worker that crashes, or exceeds the call timeout, is replaced by a
+    fresh one; the affected call raises RuntimeError or TimeoutError.
+    """
+
+    def __init__(self, plugin_dirs: List[str], plugin_name: str,
+                 config: Optional[Dict[str, Any]] = None, processes: Optional[int] = None,
+                 timeout: Optional[float] = None,
+                 shm_threshold: int = DEFAULT_SHM_THRESHOLD,
+                 start_method: str = 'spawn'):
+        """
+        Initialize the pool (no processes are started until start()).
+
+        Args:
+            plugin_dirs: Directories the workers search for the plugin
+            plugin_name: Name of the plugin
+            config: Configuration passed to the plugin's initialize()
+            processes: Number of worker processes (default: CPU count)
+            timeout: Seconds a call may take before its worker is killed
+            shm_threshold: Minimum size of buffers sent via shared memory
+                (0 disables shared memory)
+            start_method: multiprocessing start method for the workers
+        """
+        self.logger = logging.getLogger(__name__)
+        self.plugin_dirs = [os.path.abspath(d) for d in plugin_dirs]
+        self.plugin_name = plugin_name
+        self.config = config or {}
+        self.processes = processes or os.cpu_count() or 1
+        self.timeout = timeout
+        self.shm_threshold = shm_threshold
+        self.context = multiprocessing.get_context(start_method)
+        self.restarts = 0
+
+        self._workers: List[_Worker] = []
+        self._idle: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+
+    def start(self) -> PluginMetadata:
+        """
+        Start the worker processes.
+
+        Returns:
+            PluginMetadata: Metadata reported by the plugin
+
+        Raises:
+            Exception: If a worker could not load or initialize the plugin
+        """
+        with self._lock:
+            metadata = None
+            try:
+                for _ in range(self.processes):
+                    worker = _Worker(self)
+                    metadata = worker.start()
+                    self._workers.append(worker)
+                    self._idle.put(worker)
+            except Exception:
+                self._stop_workers()
+                raise
+            return metadata
+
+    def call(self, method: str, *args, **kwargs) -> Any:
+        """
+        Run a plugin method in an idle worker process.
+
+        Args:
+            method: One of WORKER_METHODS
+            *args: Positional arguments for the method
+            **kwargs: Keyword arguments for the method
+
+        Returns:
+            The method's result
+
+        Raises:
+            RuntimeError: If the pool is not running or the worker crashed
+            TimeoutError: If the call exceeded the pool timeout
+        """
+        if method not in WORKER_METHODS:
+            raise ValueError(f"Method cannot run in a worker: {method}")
+
+        worker = self._acquire_worker()
+        try:
+            args, kwargs = _pack_call(args, kwargs, self.shm_threshold)
+        except BaseException:
+            self._idle.put(worker)
+            raise
+        try:
+            ok, payload = worker.call(method, args, kwargs, self.timeout)
+        except TimeoutError:
+            self._restart(worker, args, kwargs)
+            raise
+        except (EOFError, OSError) as e:
+            self._restart(worker, args, kwargs)
+            raise RuntimeError(f"Worker for {self.plugin_name} crashed: {e!r}") from e
+        finally:
+            if worker.process is not None:
+                self._idle.put(worker)
+
+        if not ok:
+            # Exception raised by the plugin itself
+            raise payload
+        return _unpack(payload)
+
+    def _acquire_worker(self) -> _Worker:
+        """
+        Wait for an idle worker.
+
+        Workers can leave the pool while callers wait (a failed restart, or
+        close() swapping the idle queue), so the wait is done in short slices
+        that re-check the pool instead of blocking on one queue forever.
+        """
+        while True:
+            if not self._workers:
+                raise RuntimeError(f"Process pool for {self.plugin_name} is not running")
+            try:
+                worker = self._idle.get(timeout=IDLE_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+            if worker.process is not None and worker in self._workers:
+                return worker
+
+    def _restart(self, worker: _Worker, args: Tuple, kwargs: Dict[str, Any]) -> None:
+        """Replace a crashed or hung worker process"""
+        worker.kill()
+        for value in (*args, *kwargs.values()):
+            if isinstance(value, SharedBuffer):
+                # The worker may not have released it
+                _discard(value)
+        with self._lock:
+            if worker not in self._workers:
+                return
+            self.restarts += 1
+            self.logger.warning(f"Restarting worker for plugin: {self.plugin_name}")
+            try:
+                worker.start()
+            except Exception as e:
+                self._workers.remove(worker)
+                self.logger.error(f"Could not restart worker for {self.plugin_name}: {e}")
+
+    def after_fork(self) -> None:
+        """Start own workers in a forked child; the inherited ones belong to the parent"""
+        self._lock = threading.Lock()
+        self._workers = []
+        self._idle = queue.Queue()
+        self.start()
+
+    def close(self) -> None:
+        """Stop all worker processes"""
+        with self._lock:
+            self._stop_workers()
+
+    def _stop_workers(self) -> None:
+        for worker in self._workers:
+            worker.stop()
+        self._workers.clear()
+        self._idle = queue.Queue()
+
+
+class ProcessPlugin(Plugin):
+    """
+    Stand-in for a plugin that runs in a PluginProcessPool.
+
+    The PluginManager registers it in place of the in-process instance, so
+    execute_plugin and execute_many transparently run in worker processes.
+    """
+
+    def __init__(self, plugin_name: str, metadata: PluginMetadata, pool: PluginProcessPool):
+        """
+        Initialize the proxy.
+
+        Args:
+            plugin_name: Name of the plugin
+            metadata: Metadata reported by the worker processes
+            pool: Started process pool hosting the plugin
+        """
+        super().__init__()
+        self.plugin_name = plugin_name
+        self._metadata = metadata
+        self.pool = pool
+
+    def get_metadata(self) -> PluginMetadata:
+        return self._metadata
+
+    def initialize(self, config: Dict[str, Any] = None) -> bool:
+        """Restart the workers with a new configuration"""
+        self.pool.close()
+        self.pool.config = config or {}
+        try:
+            self._metadata = self.pool.start()
+        except Exception:
+            return False
+        return True
+
+    def execute(self, *args, **kwargs) -> Any:
+        return self.pool.call('execute', *args, **kwargs)
+
+    def execute_batch(self, items: Iterable[Any], *args, **kwargs) -> List[Any]:
+        return self.pool.call('execute_batch', list(items), *args, **kwargs)
+
+    def after_fork(self) -> None:
+        self.pool.after_fork()
+
+    def shutdown(self) -> None:
+        self.pool.close()
+        super().shutdown()
@@ -0,0 +1,84 @@
+"""Lazy plugin proxies that defer importing plugin modules"""
+
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Type
+
+from .plugin import Plugin, PluginMetadata
+
+
+class LazyPlugin(Plugin):
+    """
+    Lightweight stand-in for a plugin whose module has not been imported yet.
+
+    The proxy answers metadata queries from cached metadata. The plugin module
+    is only imported when load() is called, which the PluginManager does on
+    the first initialize_plugin/execute_plugin call before swapping the real
+    instance into its registry.
+    """
+
+    def __init__(self, plugin_name: str, metadata: PluginMetadata,
+                 loader: Callable[[], Optional[Type[Plugin]]]):
+        """
+        Initialize the proxy.
+
+        Args:
+            plugin_name: Name of the plugin
+            metadata: Cached plugin metadata
+            loader: Callable returning the real plugin class
+        """
+        super().__init__()
+        self.plugin_name = plugin_name
+        self._metadata = metadata
+        self._loader = loader
+        self._instance: Optional[Plugin] = None
+        self._lock = threading.Lock()
+
+    def get_metadata(self) -> PluginMetadata:
+        return self._metadata
+
+    def load(self) -> Plugin:
+        """
+        Import the plugin module and instantiate the real plugin.
+
+        Returns:
+            Plugin: The real plugin instance
+
+        Raises:
+            ImportError: If the plugin class could not be imported
+        """
+        with self._lock:
+            if self._instance is None:
+                plugin_class = self._loader()
+                if plugin_class is None:
+                    raise ImportError(f"Could not find plugin class for: {self.plugin_name}")
+
+                instance = plugin_class()
+                if not isinstance(instance, Plugin):
+                    raise ImportError(f"{self.plugin_name} is not a valid Plugin subclass")
+
+                self._instance = instance
+            return self._instance
+
+    @property
+    def is_loaded(self) -> bool:
+        """Check if the real plugin has been imported"""
+        return self._instance is not None
+
+    def initialize(self, config: Dict[str, Any] = None) -> bool:
+        return self.load().initialize(config)
+
+    def execute(self, *args, **kwargs) -> Any:
+        return self.load().execute(*args, **kwargs)
+
+    def execute_batch(self, items: Iterable[Any], *args, **kwargs) -> List[Any]:
+        return self.load().execute_batch(items, *args, **kwargs)
+
+    def after_fork(self) -> None:
+        self._lock = threading.Lock()
+        if self._instance is not None:
+            self._instance.after_fork()
+
+    def shutdown(self) -> None:
+        if self._instance is not None:
+            self._instance.shutdown()
+        super().shutdown()
@@ -6,10 +6,19 @@ import inspect
 import logging
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type
-
+from time import perf_counter
+from typing import Any, Dict, Iterable, List, Optional, Type
+
+from .dependencies import resolve_dependency_levels
+from .isolation import DEFAULT_SHM_THRESHOLD, PluginProcessPool, ProcessPlugin
+from .lazy import LazyPlugin
+from .manifest import ManifestEntry, PluginManifest
+from .metrics import MetricsRegistry
 from .plugin import Plugin, PluginMetadata
+from .watcher import PluginWatcher
 
 
 class PluginManager:
@@ -17,17 +26,33 @@ class PluginManager:
     Manages plugin loading, registration, and execution.
     """
 
-    def __init__(self, plugin_dirs: Optional[List[str]] = None):
+    def __init__(self, plugin_dirs: Optional[List[str]] = None,
+                 manifest_path: Optional[str] = None, lazy: bool = False,
+                 metrics: Optional[MetricsRegistry] = None):
         """
         Initialize the plugin manager.
 
         Args:
             plugin_dirs: List of directories to search for plugins
+            manifest_path: Optional path of an on-disk discovery manifest.
+                When set, discovery only rescans directories whose mtime changed.
+            lazy: Register plugins with cached manifest metadata as proxies
+                and defer importing them until first initialize/execute
+            metrics: Registry that records execute_plugin/execute_many calls
+                per plugin (None disables metrics)
         """
         self.logger = logging.getLogger(__name__)
         self._plugins: Dict[str, Plugin] = {}
         self._plugin_dirs = plugin_dirs or []
         self._metadata_cache: Dict[str, PluginMetadata] = {}
+        self._plugin_files: Dict[str, str] = {}
+        self._manifest = PluginManifest(manifest_path) if manifest_path else None
+        self._lazy = lazy
+        self.metrics = metrics
+        self._lock = threading.RLock()
+        self._defer_manifest_save = False
+        self._configs: Dict[str, Dict[str, Any]] = {}
+        self._generations: Dict[str, int] = {}
 
     def add_plugin_directory(self, directory: str) -> None:
         """
@@ -40,32 +65,103 @@ class PluginManager:
             self._plugin_dirs.append(directory)
             self.logger.info(f"Added plugin directory: {directory}")
 
-    def discover_plugins(self) -> List[str]:
+    def discover_plugins(self, force_rescan: bool = False) -> List[str]:
         """
         Discover all plugins in the registered directories.
 
+        Args:
+            force_rescan: Ignore the discovery manifest and rescan every directory
+
         Returns:
             List of discovered plugin names
         """
         discovered = []
 
+        if force_rescan and self._manifest:
+            self._manifest.clear()
+
         for plugin_dir in self._plugin_dirs:
-            if not os.path.exists(plugin_dir):
+            try:
+                root_mtime = os.stat(plugin_dir).st_mtime_ns
+            except OSError:
                 self.logger.warning(f"Plugin directory does not exist: {plugin_dir}")
                 continue
 
-            path = Path(plugin_dir)
+            root = os.path.abspath(plugin_dir)
+            names = None
+
+            if self._manifest:
+                names = self._manifest.get_root_plugins(root, root_mtime)
 
-            # Look for subdirectories containing plugin.py
-            for subdir in path.iterdir():
-                if subdir.is_dir() and not subdir.name.startswith('_'):
-                    plugin_file = subdir / "plugin.py"
-                    if plugin_file.exists():
-                        discovered.append(subdir.name)
-                        self.logger.info(f"Discovered plugin: {subdir.name}")
+            if names is None:
+                names = self._scan_plugin_directory(root, root_mtime)
+
+            for name in names:
+                discovered.append(name)
+                self.logger.info(f"Discovered plugin: {name}")
+
+        if self._manifest:
+            self._manifest.save()
 
         return discovered
 
+    def _scan_plugin_directory(self, root: str, root_mtime: int) -> List[str]:
+        """
+        Scan a plugin root directory for subdirectories containing plugin.py.
+
+        Subdirectories whose mtime matches the manifest reuse their cached entry.
+
+        Args:
+            root: Absolute path of the plugin root directory
+            root_mtime: Current mtime of the root directory (ns)
+
+        Returns:
+            List of plugin names found in the directory
+        """
+        names = []
+        entries = []
+        other_dirs = {}
+
+        with os.scandir(root) as it:
+            subdirs = [e for e in it if not e.name.startswith('_') and e.is_dir()]
+
+        for subdir in subdirs:
+            dir_mtime = subdir.stat().st_mtime_ns
+
+            entry = self._manifest.get_entry(root, subdir.name) if self._manifest else None
+            if entry is not None and entry.dir_mtime == dir_mtime:
+                names.append(entry.name)
+                entries.append(entry)
+                continue
+
+            plugin_file = os.path.join(subdir.path, "plugin.py")
+            try:
+                file_stat = os.stat(plugin_file)
+            except OSError:
+                other_dirs[subdir.path] = dir_mtime
+                continue
+
+            names.append(subdir.name)
+
+            if entry is not None and entry.matches_file(file_stat.st_mtime_ns, file_stat.st_size):
+                # Only the directory changed (e.g. __pycache__), keep cached metadata
+                entry.dir_mtime = dir_mtime
+                entries.append(entry)
+                continue
+
+            entries.append(ManifestEntry(
+                name=subdir.name,
+                path=subdir.path,
+                dir_mtime=dir_mtime,
+                file_mtime=file_stat.st_mtime_ns,
+                file_size=file_stat.st_size
+            ))
+
+        if self._manifest:
+            self._manifest.set_root(root, root_mtime, entries, other_dirs)
+
+        return names
+
     def load_plugin(self, plugin_name: str, plugin_class: Optional[Type[Plugin]] = None) -> bool:
         """
         Load a plugin by name or class.
@@ -78,6 +174,15 @@ class PluginManager:
             bool: True if loaded successfully
         """
         try:
+            if plugin_class is None and self._lazy:
+                proxy = self._create_lazy_plugin(plugin_name)
+                if proxy is not None:
+                    metadata = proxy.get_metadata()
+                    self._plugins[plugin_name] = proxy
+                    self._metadata_cache[plugin_name] = metadata
+                    self.logger.info(f"Loaded plugin (lazy): {plugin_name} v{metadata.version}")
+                    return True
+
             if plugin_class is None:
                 # Try to import from plugin directories
                 plugin_class = self._import_plugin_class(plugin_name)
@@ -101,6 +206,15 @@ class PluginManager:
             self._plugins[plugin_name] = plugin_instance
             self._metadata_cache[plugin_name] = metadata
 
+            plugin_file = self._plugin_files.get(plugin_name)
+            if self._manifest and plugin_file:
+                with self._lock:
+                    self._manifest.record_plugin(
+                        plugin_name, plugin_file, metadata, plugin_class.__name__
+                    )
+                    if not self._defer_manifest_save:
+                        self._manifest.save()
+
             self.logger.info(f"Loaded plugin: {plugin_name} v{metadata.version}")
             return True
 
@@ -108,16 +222,161 @@ class PluginManager:
             self.logger.error(f"Failed to load plugin {plugin_name}: {e}")
             return False
 
-    def _import_plugin_class(self, plugin_name: str) -> Optional[Type[Plugin]]:
+    def load_all(self, plugin_names: Optional[List[str]] = None,
+                 max_workers: Optional[int] = None) -> Dict[str, bool]:
+        """
+        Load several plugins concurrently.
+
+        Args:
+            plugin_names: Plugins to load, or None to load all discovered plugins
+            max_workers: Maximum number of loader threads
+
+        Returns:
+            Mapping of plugin name to whether it loaded successfully
+        """
+        if plugin_names is None:
+            plugin_names = self.discover_plugins()
+
+        self._defer_manifest_save = True
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = dict(zip(plugin_names, executor.map(self.load_plugin, plugin_names)))
+        finally:
+            self._defer_manifest_save = False
+            if self._manifest:
+                with self._lock:
+                    self._manifest.save()
+
+        return results
+
+    def initialize_all(self, configs: Optional[Dict[str, Dict[str, Any]]] = None,
+                       max_workers: Optional[int] = None) -> Dict[str, bool]:
+        """
+        Initialize all loaded plugins in dependency order.
+
+        Plugins are grouped into levels using PluginMetadata.dependencies.
+        Plugins within a level are initialized concurrently on a thread pool;
+        a plugin whose dependency failed or is not loaded is not initialized.
+        Plugins that are already initialized keep their configuration and are
+        reported as successful; use initialize_plugin() to reconfigure one.
+
+        Args:
+            configs: Optional mapping of plugin name to configuration dictionary
+            max_workers: Maximum number of initializer threads
+
+        Returns:
+            Mapping of plugin name to whether it initialized successfully
+
+        Raises:
+            ValueError: If the plugin dependencies contain a cycle
+        """
+        configs = configs or {}
+        dependencies = {
+            name: list(self._metadata_cache[name].dependencies)
+            for name in self._plugins
+            if name in self._metadata_cache
+        }
+        levels = resolve_dependency_levels(dependencies)
+        results: Dict[str, bool] = {}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for level in levels:
+                ready = []
+                for name in level:
+                    if self._plugins[name].is_initialized:
+                        results[name] = True
+                        continue
+                    missing = [dep for dep in dependencies[name]
+                               if not self._dependency_satisfied(dep, results)]
+                    if missing:
+                        self.logger.error(
+                            f"Cannot initialize {name}, missing dependencies: {', '.join(missing)}"
+                        )
+                        results[name] = False
+                    else:
+                        ready.append(name)
+
+                outcomes = executor.map(
+                    lambda name: self.initialize_plugin(name, configs.get(name)),
+                    ready
+                )
+                results.update(zip(ready, outcomes))
+
+        return results
+
+    def _dependency_satisfied(self, dependency: str, results: Dict[str, bool]) -> bool:
+        """Check whether a dependency was initialized in this batch or earlier"""
+        if dependency in results:
+            return results[dependency]
+        plugin = self._plugins.get(dependency)
+        return plugin is not None and plugin.is_initialized
+
+    def _create_lazy_plugin(self, plugin_name: str) -> Optional[LazyPlugin]:
+        """
+        Build a lazy proxy from the discovery manifest.
+
+        Args:
+            plugin_name: Name of the plugin
+
+        Returns:
+            LazyPlugin, or None if the manifest has no up-to-date metadata
+        """
+        if not self._manifest:
+            return None
+
+        entry = self._manifest.find_entry(plugin_name)
+        if entry is None or entry.metadata is None or entry.class_name is None:
+            return None
+
+        try:
+            file_stat = os.stat(os.path.join(entry.path, "plugin.py"))
+        except OSError:
+            return None
+
+        if not entry.matches_file(file_stat.st_mtime_ns, file_stat.st_size):
+            return None
+
+        class_name = entry.class_name
+        return LazyPlugin(
+            plugin_name,
+            entry.get_metadata(),
+            lambda: self._import_plugin_class(plugin_name, class_name)
+        )
+
+    def _materialize_plugin(self, plugin_name: str) -> Plugin:
+        """
+        Replace a lazy proxy with the real plugin instance.
+
+        Args:
+            plugin_name: Name of a loaded plugin
+
+        Returns:
+            Plugin: The real plugin instance
+        """
+        plugin = self._plugins[plugin_name]
+        if isinstance(plugin, LazyPlugin):
+            plugin = plugin.load()
+            self._plugins[plugin_name] = plugin
+            self.logger.info(f"Imported lazy plugin: {plugin_name}")
+        return plugin
+
+    def _import_plugin_class(self, plugin_name: str, class_name: Optional[str] = None,
+                             module_name: Optional[str] = None) -> Optional[Type[Plugin]]:
         """
         Import a plugin class from plugin directories.
 
         Args:
             plugin_name: Name of the plugin
+            class_name: Optional name of the Plugin subclass, which skips
+                scanning the module members
+            module_name: Name to import the module under
+                (default: plugins.<plugin_name>)
 
         Returns:
             Plugin class or None
         """
+        module_name = module_name or f"plugins.{plugin_name}"
+
         for plugin_dir in self._plugin_dirs:
             plugin_path = Path(plugin_dir) / plugin_name / "plugin.py"
 
@@ -125,18 +384,27 @@ class PluginManager:
                 try:
                     # Import the module
                     spec = importlib.util.spec_from_file_location(
-                        f"plugins.{plugin_name}",
+                        module_name,
                         plugin_path
                     )
                     module = importlib.util.module_from_spec(spec)
-                    sys.modules[f"plugins.{plugin_name}"] = module
+                    sys.modules[module_name] = module
                     spec.loader.exec_module(module)
 
+                    if class_name:
+                        obj = getattr(module, class_name, None)
+                        if (inspect.isclass(obj) and
+                            issubclass(obj, Plugin) and
+                            obj is not Plugin):
+                            self._plugin_files[plugin_name] = str(plugin_path)
+                            return obj
+
                     # Find the Plugin subclass
                     for name, obj in inspect.getmembers(module):
                         if (inspect.isclass(obj) and
                             issubclass(obj, Plugin) and
                             obj is not Plugin):
+                            self._plugin_files[plugin_name] = str(plugin_path)
                             return obj
 
                 except Exception as e:
@@ -159,12 +427,13 @@ class PluginManager:
             self.logger.error(f"Plugin not loaded: {plugin_name}")
             return False
 
-        plugin = self._plugins[plugin_name]
-
         try:
+            plugin = self._materialize_plugin(plugin_name)
+
             if plugin.initialize(config or {}):
                 plugin.enable()
                 plugin._initialized = True
+                self._configs[plugin_name] = config or {}
                 self.logger.info(f"Initialized plugin: {plugin_name}")
                 return True
             else:
@@ -174,6 +443,197 @@ class PluginManager:
             self.logger.error(f"Error initializing {plugin_name}: {e}")
             return False
 
+    def reload_plugin(self, plugin_name: str, config: Dict[str, Any] = None,
+                      grace_period: float = 1.0) -> bool:
+        """
+        Reload a plugin from its (changed) plugin.py without downtime.
+
+        The new version is imported under a fresh module name and, if the
+        current instance is initialized, initialized next to it with the same
+        configuration. It is then swapped into the registry in one step; the
+        old instance keeps serving calls already in progress and is shut down
+        after the grace period. If the new version fails to import or
+        initialize, the old instance stays registered.
+
+        Isolated plugins are reloaded by starting a new worker pool; the old
+        pool is shut down after the grace period as well.
+
+        Args:
+            plugin_name: Name of the plugin
+            config: Configuration for the new version (default: the last
+                configuration the plugin was initialized with)
+            grace_period: Seconds before the old instance is shut down
+
+        Returns:
+            bool: True if the new version was swapped in
+        """
+        current = self._plugins.get(plugin_name)
+        if current is None:
+            self.logger.error(f"Plugin not loaded: {plugin_name}")
+            return False
+
+        if isinstance(current, ProcessPlugin):
+            pool = current.pool
+            proxy = self._start_process_plugin(
+                plugin_name, pool.config if config is None else config,
+                processes=pool.processes, timeout=pool.timeout,
+                shm_threshold=pool.shm_threshold,
+                start_method=pool.context.get_start_method()
+            )
+            if proxy is None:
+                return False
+
+            with self._lock:
+                previous = self._plugins.get(plugin_name)
+                self._plugins[plugin_name] = proxy
+                self._metadata_cache[plugin_name] = proxy.get_metadata()
+            if previous is not None:
+                self._retire_plugin(plugin_name, previous, grace_period)
+
+            self.logger.info(f"Reloaded isolated plugin: {plugin_name}")
+            return True
+
+        with self._lock:
+            generation = self._generations.get(plugin_name, 0) + 1
+            self._generations[plugin_name] = generation
+        module_name = f"plugins.{plugin_name}_r{generation}"
+
+        plugin_class = self._import_plugin_class(plugin_name, module_name=module_name)
+        if plugin_class is None:
+            sys.modules.pop(module_name, None)
+            self.logger.error(f"Could not reload plugin: {plugin_name}")
+            return False
+
+        if config is None:
+            config = self._configs.get(plugin_name, {})
+
+        try:
+            plugin = plugin_class()
+            if not isinstance(plugin, Plugin):
+                raise TypeError(f"{plugin_name} is not a valid Plugin subclass")
+            metadata = plugin.get_metadata()
+
+            if current.is_initialized:
+                if not plugin.initialize(config):
+                    raise RuntimeError("initialize() returned False")
+                plugin._initialized = True
+            if current.is_enabled:
+                plugin.enable()
+        except Exception as e:
+            sys.modules.pop(module_name, None)
+            self.logger.error(f"Failed to reload plugin {plugin_name}: {e}")
+            return False
+
+        with self._lock:
+            previous = self._plugins.get(plugin_name)
+            self._plugins[plugin_name] = plugin
+            self._metadata_cache[plugin_name] = metadata
+            if plugin.is_initialized:
+                self._configs[plugin_name] = config
+            sys.modules[f"plugins.{plugin_name}"] = sys.modules[module_name]
+
+            plugin_file = self._plugin_files.get(plugin_name)
+            if self._manifest and plugin_file:
+                self._manifest.record_plugin(
+                    plugin_name, plugin_file, metadata, plugin_class.__name__
+                )
+                self._manifest.save()
+
+        if previous is not None:
+            self._retire_plugin(plugin_name, previous, grace_period)
+
+        self.logger.info(f"Reloaded plugin: {plugin_name} v{metadata.version}")
+        return True
+
+    def _retire_plugin(self, plugin_name: str, plugin: Plugin, grace_period: float) -> None:
+        """Shut down a replaced plugin instance once in-flight calls had time to finish"""
+        def retire():
+            try:
+                plugin.shutdown()
+            except Exception as e:
+                self.logger.error(f"Error shutting down old version of {plugin_name}: {e}")
+            module_name = type(plugin).__module__
+            if module_name.startswith(f"plugins.{plugin_name}_r"):
+                sys.modules.pop(module_name, None)
+
+        if grace_period <= 0:
+            retire()
+            return
+        timer = threading.Timer(grace_period, retire)
+        timer.daemon = True
+        timer.start()
+
+    def watch_plugins(self, interval: float = 1.0, grace_period: float = 1.0) -> PluginWatcher:
+        """
+        Start a background watcher that hot-reloads changed plugins.
+
+        Args:
+            interval: Seconds between checks of the plugin files
+            grace_period: Seconds before a replaced instance is shut down
+
+        Returns:
+            PluginWatcher: The started watcher; call stop() to end watching
+        """
+        watcher = PluginWatcher(self, interval=interval, grace_period=grace_period)
+        watcher.start()
+        return watcher
+
+    def isolate_plugin(self, plugin_name: str, config: Dict[str, Any] = None,
+                       processes: Optional[int] = None, timeout: Optional[float] = None,
+                       shm_threshold: int = DEFAULT_SHM_THRESHOLD,
+                       start_method: str = 'spawn') -> bool:
+        """
+        Run a plugin in a pool of worker processes.
+
+        Each worker loads and initializes the plugin from the plugin
+        directories. The in-process instance, if any, is shut down and
+        replaced by a proxy, so execute_plugin and execute_many run in the
+        workers. Crashed or timed-out workers are restarted automatically.
+
+        Args:
+            plugin_name: Name of the plugin
+            config: Configuration passed to the plugin in every worker
+            processes: Number of worker processes (default: CPU count)
+            timeout: Seconds a call may take before its worker is killed
+            shm_threshold: Minimum size of bytes-like arguments and results
+                passed through shared memory (0 disables shared memory)
+            start_method: multiprocessing start method for the workers
+
+        Returns:
+            bool: True if the worker processes started
+        """
+        proxy = self._start_process_plugin(
+            plugin_name, config, processes=processes, timeout=timeout,
+            shm_threshold=shm_threshold, start_method=start_method
+        )
+        if proxy is None:
+            return False
+
+        previous = self._plugins.get(plugin_name)
+        if previous is not None:
+            previous.shutdown()
+
+        self._plugins[plugin_name] = proxy
+        self._metadata_cache[plugin_name] = proxy.get_metadata()
+
+        self.logger.info(f"Isolated plugin: {plugin_name} ({proxy.pool.processes} worker processes)")
+        return True
+
+    def _start_process_plugin(self, plugin_name: str, config: Optional[Dict[str, Any]],
+                              **pool_options) -> Optional[ProcessPlugin]:
+        """Start a worker pool for a plugin and wrap it in a ProcessPlugin proxy"""
+        pool = PluginProcessPool(self._plugin_dirs, plugin_name, config, **pool_options)
+        try:
+            metadata = pool.start()
+        except Exception as e:
+            self.logger.error(f"Failed to start worker processes for {plugin_name}: {e}")
+            return None
+
+        proxy = ProcessPlugin(plugin_name, metadata, pool)
+        proxy.enable()
+        proxy._initialized = True
+        return proxy
+
     def execute_plugin(self, plugin_name: str, *args, **kwargs) -> Any:
         """
         Execute a plugin's main functionality.
@@ -191,10 +651,66 @@ class PluginManager:
 
         plugin = self._plugins[plugin_name]
 
+        if isinstance(plugin, LazyPlugin):
+            plugin = self._materialize_plugin(plugin_name)
+
+        if not plugin.is_enabled:
+            raise RuntimeError(f"Plugin is not enabled: {plugin_name}")
+
+        metrics = self.metrics
+        if metrics is None:
+            return plugin.execute(*args, **kwargs)
+
+        series = metrics.begin('plugin', plugin_name)
+        started = perf_counter()
+        failed = 1
+        try:
+            result = plugin.execute(*args, **kwargs)
+            failed = 0
+            return result
+        finally:
+            series.end(perf_counter() - started, failed)
+
+    def execute_many(self, plugin_name: str, items: Iterable[Any], *args, **kwargs) -> List[Any]:
+        """
+        Execute a plugin for a batch of items.
+
+        The plugin lookup and enabled check happen once for the whole batch,
+        which is then handed to the plugin's execute_batch().
+
+        Args:
+            plugin_name: Name of the plugin
+            items: Items to process
+            *args: Positional arguments passed after each item
+            **kwargs: Keyword arguments for the plugin
+
+        Returns:
+            List of execution results, one per item
+        """
+        if plugin_name not in self._plugins:
+            raise ValueError(f"Plugin not loaded: {plugin_name}")
+
+        plugin = self._plugins[plugin_name]
+
+        if isinstance(plugin, LazyPlugin):
+            plugin = self._materialize_plugin(plugin_name)
+
         if not plugin.is_enabled:
             raise RuntimeError(f"Plugin is not enabled: {plugin_name}")
 
-        return plugin.execute(*args, **kwargs)
+        metrics = self.metrics
+        if metrics is None:
+            return plugin.execute_batch(items, *args, **kwargs)
+
+        series = metrics.begin('plugin', plugin_name)
+        started = perf_counter()
+        failed = 1
+        try:
+            result = plugin.execute_batch(items, *args, **kwargs)
+            failed = 0
+            return result
+        finally:
+            series.end(perf_counter() - started, failed)
 
     def unload_plugin(self, plugin_name: str) -> bool:
         """
@@ -219,6 +735,20 @@ class PluginManager:
         self.logger.info(f"Unloaded plugin: {plugin_name}")
         return True
 
+    def after_fork(self) -> None:
+        """
+        Prepare the loaded plugins for use in a forked child process.
+
+        Call once in the child right after os.fork(). Every loaded plugin's
+        after_fork() is called so it can reopen per-process resources.
+        """
+        self._lock = threading.RLock()
+        for plugin_name, plugin in list(self._plugins.items()):
+            try:
+                plugin.after_fork()
+            except Exception as e:
+                self.logger.error(f"Error in after_fork of {plugin_name}: {e}")
+
     def get_plugin(self, plugin_name: str) -> Optional[Plugin]:
         """Get a plugin instance by name"""
         return self._plugins.get(plugin_name)
@@ -0,0 +1,217 @@
+"""Persistent discovery manifest for plugin directories"""
+
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional
+
+from .plugin import PluginMetadata
+
+
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class ManifestEntry:
+    """Cached discovery information for a single plugin directory"""
+    name: str
+    path: str
+    dir_mtime: int
+    file_mtime: int
+    file_size: int
+    metadata: Optional[Dict[str, Any]] = None
+    class_name: Optional[str] = None
+
+    def matches_file(self, file_mtime: int, file_size: int) -> bool:
+        """Check whether the cached plugin.py stat is still current"""
+        return self.file_mtime == file_mtime and self.file_size == file_size
+
+    def get_metadata(self) -> Optional[PluginMetadata]:
+        """Rebuild the cached PluginMetadata, if any was recorded"""
+        if self.metadata is None:
+            return None
+        return PluginMetadata(**self.metadata)
+
+
+class PluginManifest:
+    """
+    On-disk cache of discovered plugins.
+
+    The manifest is keyed by plugin root directory. Each root stores its own
+    mtime together with one ManifestEntry per plugin subdirectory (and the
+    mtimes of subdirectories without a plugin.py), so that discovery only has
+    to rescan roots and subdirectories whose mtime changed.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the manifest.
+
+        Args:
+            path: Location of the manifest JSON file
+        """
+        self.logger = logging.getLogger(__name__)
+        self.path = path
+        self._roots: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self.load()
+
+    def load(self) -> None:
+        """Load the manifest from disk, discarding it if unreadable or outdated"""
+        self._roots = {}
+        self._dirty = False
+
+        if not os.path.exists(self.path):
+            return
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable plugin manifest {self.path}: {e}")
+            return
+
+        if data.get('version') != MANIFEST_VERSION:
+            self.logger.info(f"Discarding plugin manifest with old version: {self.path}")
+            return
+
+        for root, root_data in data.get('roots', {}).items():
+            self._roots[root] = {
+                'mtime': root_data['mtime'],
+                'plugins': {
+                    name: ManifestEntry(**entry)
+                    for name, entry in root_data.get('plugins', {}).items()
+                },
+                'other_dirs': root_data.get('other_dirs', {})
+            }
+
+    def save(self) -> None:
+        """Write the manifest to disk if it changed since the last load/save"""
+        if not self._dirty:
+            return
+
+        data = {
+            'version': MANIFEST_VERSION,
+            'roots': {
+                root: {
+                    'mtime': root_data['mtime'],
+                    'plugins': {
+                        name: asdict(entry)
+                        for name, entry in root_data['plugins'].items()
+                    },
+                    'other_dirs': root_data['other_dirs']
+                }
+                for root, root_data in self._roots.items()
+            }
+        }
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        tmp_path = f"{self.path}.tmp"
+
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError as e:
+            self.logger.warning(f"Could not write plugin manifest {self.path}: {e}")
+
+    def clear(self) -> None:
+        """Drop all cached entries"""
+        self._roots = {}
+        self._dirty = True
+
+    def get_root_plugins(self, root: str, mtime: int) -> Optional[List[str]]:
+        """
+        Get the cached plugin names of a root directory.
+
+        Each cached subdirectory is stat'ed as well, since adding or removing
+        plugin.py changes the subdirectory's mtime but not the root's.
+
+        Args:
+            root: Plugin root directory
+            mtime: Current mtime of the root directory (ns)
+
+        Returns:
+            List of plugin names, or None if the root must be rescanned
+        """
+        root_data = self._roots.get(root)
+        if root_data is None or root_data['mtime'] != mtime:
+            return None
+
+        subdirs = [(entry.path, entry.dir_mtime) for entry in root_data['plugins'].values()]
+        subdirs.extend(root_data['other_dirs'].items())
+        for path, cached_mtime in subdirs:
+            try:
+                dir_mtime = os.stat(path).st_mtime_ns
+            except OSError:
+                return None
+            if dir_mtime != cached_mtime:
+                return None
+        return list(root_data['plugins'].keys())
+
+    def get_entry(self, root: str, name: str) -> Optional[ManifestEntry]:
+        """Get the cached entry for a plugin in a root directory"""
+        root_data = self._roots.get(root)
+        if root_data is None:
+            return None
+        return root_data['plugins'].get(name)
+
+    def find_entry(self, name: str) -> Optional[ManifestEntry]:
+        """Get the first cached entry for a plugin name across all roots"""
+        for root_data in self._roots.values():
+            entry = root_data['plugins'].get(name)
+            if entry is not None:
+                return entry
+        return None
+
+    def set_root(self, root: str, mtime: int, entries: List[ManifestEntry],
+                 other_dirs: Optional[Dict[str, int]] = None) -> None:
+        """
+        Replace the cached contents of a root directory.
+
+        Args:
+            root: Plugin root directory
+            mtime: Current mtime of the root directory (ns)
+            entries: Entries for every plugin found in the root
+            other_dirs: Path -> mtime (ns) of subdirectories without plugin.py
+        """
+        self._roots[root] = {
+            'mtime': mtime,
+            'plugins': {entry.name: entry for entry in entries},
+            'other_dirs': other_dirs or {}
+        }
+        self._dirty = True
+
+    def record_plugin(self, name: str, plugin_file: str,
+                      metadata: PluginMetadata, class_name: str) -> None:
+        """
+        Record metadata and class name of a plugin after it has been imported.
+
+        Args:
+            name: Plugin name
+            plugin_file: Path of the imported plugin.py
+            metadata: Plugin metadata
+            class_name: Name of the Plugin subclass in plugin.py
+        """
+        plugin_dir = os.path.dirname(os.path.abspath(plugin_file))
+        root = os.path.dirname(plugin_dir)
+        entry = self.get_entry(root, name)
+
+        try:
+            file_stat = os.stat(plugin_file)
+        except OSError:
+            return
+
+        if entry is None:
+            # Imported without prior discovery; the root still needs a scan
+            # before its entry can be trusted, so do not cache it
+            return
+
+        entry.file_mtime = file_stat.st_mtime_ns
+        entry.file_size = file_stat.st_size
+        entry.metadata = asdict(metadata)
+        entry.class_name = class_name
+        self._dirty = True
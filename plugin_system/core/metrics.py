@@ -0,0 +1,254 @@
+"""Execution metrics for plugins and hooks"""
+
+import os
+import socket
+import threading
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Latency bucket upper bounds in seconds: 1us .. 10s in 1/2.5/5 steps
+LATENCY_BUCKETS = tuple(
+    round(base * 10.0 ** exponent, 12) for exponent in range(-6, 1) for base in (1, 2.5, 5)
+) + (10.0,)
+
+# Kinds of measured calls; also the Prometheus label name of each kind
+METRIC_KINDS = ('plugin', 'hook')
+
+
+class Histogram:
+    """
+    Latency histogram with fixed bucket bounds.
+
+    Memory use is constant: one counter per bucket plus an overflow bucket,
+    a running sum and a count.
+    """
+
+    __slots__ = ('bounds', 'counts', 'total', 'count')
+
+    def __init__(self, bounds: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Record one value (caller holds the series lock)"""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile as the upper bound of the bucket containing it.
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            Bucket bound in seconds (inf for the overflow bucket), or None if empty
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                return self.bounds[index] if index < len(self.bounds) else float('inf')
+        return float('inf')
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """Cumulative counts per upper bound, ending with (inf, count)"""
+        result = []
+        seen = 0
+        for bound, bucket_count in zip(self.bounds + (float('inf'),), self.counts):
+            seen += bucket_count
+            result.append((bound, seen))
+        return result
+
+
+class MetricSeries:
+    """Call count, error count, in-flight gauge and latency of one plugin or hook"""
+
+    __slots__ = ('calls', 'errors', 'in_flight', 'latency', '_lock')
+
+    def __init__(self, bounds: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.calls = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.latency = Histogram(bounds)
+        self._lock = threading.Lock()
+
+    def begin(self) -> None:
+        """Mark a call as started"""
+        with self._lock:
+            self.in_flight += 1
+
+    def end(self, elapsed: float, errors: int = 0) -> None:
+        """
+        Mark a call as finished.
+
+        Args:
+            elapsed: Duration of the call in seconds
+            errors: Number of errors the call produced
+        """
+        with self._lock:
+            self.in_flight -= 1
+            self.calls += 1
+            self.errors += errors
+            self.latency.observe(elapsed)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            latency = self.latency
+            return {
+                'calls': self.calls,
+                'errors': self.errors,
+                'in_flight': self.in_flight,
+                'latency_sum': latency.total,
+                'latency_p50': latency.quantile(0.5),
+                'latency_p99': latency.quantile(0.99),
+                'latency_buckets': latency.cumulative()
+            }
+
+
+class MetricsRegistry:
+    """
+    Collects execution metrics per plugin and per hook.
+
+    Pass a registry to PluginManager and/or HookManager to enable metrics;
+    without one, no measurements are taken.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        """
+        Initialize the registry.
+
+        Args:
+            buckets: Ascending latency bucket upper bounds in seconds
+        """
+        self.buckets = tuple(buckets)
+        self._series: Dict[Tuple[str, str], MetricSeries] = {}
+        self._lock = threading.Lock()
+
+    def series(self, kind: str, name: str) -> MetricSeries:
+        """
+        Get the series of a plugin or hook, creating it on first use.
+
+        Args:
+            kind: 'plugin' or 'hook'
+            name: Plugin or hook name
+
+        Returns:
+            MetricSeries: The series
+        """
+        key = (kind, name)
+        series = self._series.get(key)
+        if series is None:
+            with self._lock:
+                series = self._series.get(key)
+                if series is None:
+                    series = MetricSeries(self.buckets)
+                    self._series[key] = series
+        return series
+
+    def begin(self, kind: str, name: str) -> MetricSeries:
+        """Mark a call as started and return its series for end()"""
+        series = self._series.get((kind, name))
+        if series is None:
+            series = self.series(kind, name)
+        series.begin()
+        return series
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Take a consistent copy of all metrics.
+
+        Returns:
+            Dictionary with 'plugins' and 'hooks', each mapping names to
+            calls, errors, in_flight, latency_sum, latency_p50, latency_p99
+            and cumulative latency_buckets
+        """
+        result: Dict[str, Dict[str, Dict[str, Any]]] = {f"{kind}s": {} for kind in METRIC_KINDS}
+        for (kind, name), series in list(self._series.items()):
+            result[f"{kind}s"][name] = series.snapshot()
+        return result
+
+    def reset(self) -> None:
+        """Drop all collected metrics"""
+        with self._lock:
+            self._series.clear()
+
+    def to_prometheus(self) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: Metrics text
+        """
+        snapshot = self.snapshot()
+        lines = []
+        for kind in METRIC_KINDS:
+            series = snapshot[f"{kind}s"]
+            prefix = f"plugin_system_{kind}"
+            label = kind
+
+            lines.append(f"# TYPE {prefix}_calls_total counter")
+            for name, values in series.items():
+                lines.append(f'{prefix}_calls_total{{{label}="{_escape(name)}"}} {values["calls"]}')
+
+            lines.append(f"# TYPE {prefix}_errors_total counter")
+            for name, values in series.items():
+                lines.append(f'{prefix}_errors_total{{{label}="{_escape(name)}"}} {values["errors"]}')
+
+            lines.append(f"# TYPE {prefix}_in_flight gauge")
+            for name, values in series.items():
+                lines.append(f'{prefix}_in_flight{{{label}="{_escape(name)}"}} {values["in_flight"]}')
+
+            lines.append(f"# TYPE {prefix}_latency_seconds histogram")
+            for name, values in series.items():
+                labels = f'{label}="{_escape(name)}"'
+                for bound, cumulative in values['latency_buckets']:
+                    le = '+Inf' if bound == float('inf') else repr(bound)
+                    lines.append(f'{prefix}_latency_seconds_bucket{{{labels},le="{le}"}} {cumulative}')
+                lines.append(f'{prefix}_latency_seconds_sum{{{labels}}} {values["latency_sum"]}')
+                lines.append(f'{prefix}_latency_seconds_count{{{labels}}} {values["calls"]}')
+
+        return '\n'.join(lines) + '\n'
+
+    def export_prometheus(self, path: Optional[str] = None,
+                          socket_path: Optional[str] = None) -> None:
+        """
+        Write the Prometheus text to a file and/or a local (Unix) socket.
+
+        The file is replaced atomically, so a scraper (e.g. the node exporter
+        textfile collector) never reads a partial file.
+
+        Args:
+            path: File to write
+            socket_path: Unix socket to connect to and send the text over
+
+        Raises:
+            ValueError: If neither target is given
+        """
+        if path is None and socket_path is None:
+            raise ValueError("export_prometheus needs a path or a socket_path")
+
+        data = self.to_prometheus().encode('utf-8')
+
+        if path is not None:
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+
+        if socket_path is not None:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.connect(socket_path)
+                sock.sendall(data)
+
+
+def _escape(value: str) -> str:
+    """Escape a Prometheus label value"""
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
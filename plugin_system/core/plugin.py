@@ -2,7 +2,7 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 
 @dataclass
@@ -68,6 +68,35 @@ class Plugin(ABC):
         """
         pass
 
+    def execute_batch(self, items: Iterable[Any], *args, **kwargs) -> List[Any]:
+        """
+        Execute the plugin for every item of a batch.
+
+        The default implementation calls execute() once per item. Override this
+        method to provide a vectorized implementation.
+
+        Args:
+            items: Items to process; each is passed as the first argument
+            *args: Positional arguments passed after each item
+            **kwargs: Keyword arguments passed with each item
+
+        Returns:
+            List of execution results, one per item
+        """
+        execute = self.execute
+        return [execute(item, *args, **kwargs) for item in items]
+
+    def after_fork(self) -> None:
+        """
+        Reinitialize per-process resources in a forked child process.
+
+        Called by PluginManager.after_fork() in a worker forked from a
+        process where the plugin was already loaded. Override this method to
+        reopen files, sockets or background threads that must not be shared
+        with the parent.
+        """
+        pass
+
     def shutdown(self) -> None:
         """
         Clean up plugin resources.
@@ -0,0 +1,98 @@
+"""Polling watcher that hot-reloads changed plugin files"""
+
+import logging
+import os
+import threading
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .manager import PluginManager
+
+
+class PluginWatcher:
+    """
+    Watches the plugin.py files of loaded plugins and reloads changed ones.
+
+    Each check compares the mtime and size of every file with the previous
+    check, so a check costs one stat() per loaded plugin. A change is
+    reloaded through PluginManager.reload_plugin(); a version that fails to
+    load is not retried until the file changes again.
+    """
+
+    def __init__(self, manager: 'PluginManager', interval: float = 1.0,
+                 grace_period: float = 1.0):
+        """
+        Initialize the watcher.
+
+        Args:
+            manager: Plugin manager whose plugins are watched
+            interval: Seconds between checks
+            grace_period: Seconds before a replaced instance is shut down
+        """
+        self.logger = logging.getLogger(__name__)
+        self.manager = manager
+        self.interval = interval
+        self.grace_period = grace_period
+        self._stamps: Dict[str, Tuple[int, int]] = {}
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Record the current file state and start checking in the background"""
+        if self._thread is not None:
+            return
+        self._snapshot()
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name='PluginWatcher', daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread"""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def check(self) -> List[str]:
+        """
+        Reload every plugin whose file changed since the last check.
+
+        Returns:
+            List of plugins that were reloaded
+        """
+        reloaded = []
+        for plugin_name, stamp in self._current_stamps().items():
+            previous = self._stamps.get(plugin_name)
+            self._stamps[plugin_name] = stamp
+            if previous is None or previous == stamp:
+                continue
+
+            self.logger.info(f"Plugin file changed: {plugin_name}")
+            if self.manager.reload_plugin(plugin_name, grace_period=self.grace_period):
+                reloaded.append(plugin_name)
+        return reloaded
+
+    def _snapshot(self) -> None:
+        self._stamps = self._current_stamps()
+
+    def _current_stamps(self) -> Dict[str, Tuple[int, int]]:
+        stamps = {}
+        for plugin_name in self.manager.list_plugins():
+            plugin_file = self.manager._plugin_files.get(plugin_name)
+            if plugin_file is None:
+                continue
+            try:
+                file_stat = os.stat(plugin_file)
+            except OSError:
+                continue
+            stamps[plugin_name] = (file_stat.st_mtime_ns, file_stat.st_size)
+        return stamps
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            try:
+                self.check()
+            except Exception as e:
+                self.logger.error(f"Plugin watcher check failed: {e}")
@@ -0,0 +1,387 @@
+"""Logging handlers used by the logger plugin"""
+
+import gzip
+import logging
+import os
+import queue
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+# What to do with a record when the async queue is full
+OVERFLOW_POLICIES = ('block', 'drop_oldest', 'sample')
+
+# File handlers shared by all logger plugin instances: path -> [handler, users, settings]
+_shared_file_handlers: Dict[str, List[Any]] = {}
+_shared_lock = threading.Lock()
+# Process that created the shared handlers
+_shared_pid = os.getpid()
+
+# Numbers logger names; kept here because this module is imported once under
+# its real name, while the plugin module is re-imported on every (re)load
+_logger_ids = count(1)
+
+
+def new_logger_name(prefix: str) -> str:
+    """Get a logger name that is unique within the process"""
+    return f"{prefix}.{next(_logger_ids)}"
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    Queue handler for a bounded queue with a configurable overflow policy.
+
+    Overflow policies:
+        - block: wait until the writer thread frees a slot
+        - drop_oldest: discard the oldest queued record to make room
+        - sample: keep one in `sample_rate` overflowing records (blocking for
+          those) and drop the rest
+
+    Records are queued as-is; formatting happens on the writer thread.
+    """
+
+    def __init__(self, log_queue: queue.Queue, overflow_policy: str = 'block',
+                 sample_rate: int = 10):
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow_policy}")
+        super().__init__(log_queue)
+        self.overflow_policy = overflow_policy
+        self.sample_rate = max(1, sample_rate)
+        self.dropped = 0
+        self._overflows = 0
+        self._overflow_lock = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.overflow_policy == 'block':
+            self.queue.put(record)
+            return
+
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+
+        if self.overflow_policy == 'drop_oldest':
+            while True:
+                try:
+                    self.queue.get_nowait()
+                    self.queue.task_done()
+                    with self._overflow_lock:
+                        self.dropped += 1
+                except queue.Empty:
+                    pass
+                try:
+                    self.queue.put_nowait(record)
+                    return
+                except queue.Full:
+                    continue
+
+        with self._overflow_lock:
+            self._overflows += 1
+            keep = self._overflows % self.sample_rate == 0
+            if not keep:
+                self.dropped += 1
+        if keep:
+            self.queue.put(record)
+
+
+class BlockingQueueListener(QueueListener):
+    """Queue listener whose stop sentinel waits for room in a full queue"""
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+
+def start_queue_logging(handlers: List[logging.Handler], queue_size: int = 10000,
+                        overflow_policy: str = 'block',
+                        sample_rate: int = 10) -> Tuple[BoundedQueueHandler, BlockingQueueListener]:
+    """
+    Route records through a bounded queue to a background writer thread.
+
+    Args:
+        handlers: Handlers that do the actual writing on the writer thread
+        queue_size: Maximum number of queued records
+        overflow_policy: One of OVERFLOW_POLICIES
+        sample_rate: Keep one in this many overflowing records ('sample' policy)
+
+    Returns:
+        tuple: (handler to attach to the logger, started listener)
+    """
+    log_queue = queue.Queue(maxsize=queue_size)
+    handler = BoundedQueueHandler(log_queue, overflow_policy, sample_rate)
+    listener = BlockingQueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return handler, listener
+
+
+class BufferedRotatingFileHandler(logging.Handler):
+    """
+    File handler that batches records into large writes and rotates the file.
+
+    Formatters may return text (written as a line) or bytes (written as-is,
+    e.g. binary records). Formatted records are buffered in memory and written in one call once
+    `buffer_size` bytes are pending or `flush_interval` seconds have passed
+    (a background thread flushes idle buffers). The file is rotated when it
+    would exceed `max_bytes` or is older than `rotate_interval` seconds.
+    Rotated segments get a timestamp suffix, can be gzip-compressed on a
+    background thread, and only the newest `backup_count` are kept.
+    """
+
+    def __init__(self, filename: str, buffer_size: int = 64 * 1024,
+                 flush_interval: float = 1.0, max_bytes: int = 0,
+                 rotate_interval: float = 0, backup_count: int = 0,
+                 compress: bool = False, encoding: str = 'utf-8'):
+        """
+        Initialize the handler.
+
+        Args:
+            filename: Log file path
+            buffer_size: Pending bytes that trigger a write (0 writes every record)
+            flush_interval: Maximum seconds a record stays buffered (0 flushes
+                only on size, flush() and close())
+            max_bytes: Rotate before the file exceeds this size (0 disables)
+            rotate_interval: Rotate files older than this many seconds (0 disables)
+            backup_count: Number of rotated segments to keep (0 keeps all)
+            compress: Gzip rotated segments in the background
+            encoding: File encoding
+        """
+        super().__init__()
+        self.baseFilename = os.path.abspath(filename)
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.rotate_interval = rotate_interval
+        self.backup_count = backup_count
+        self.compress = compress
+        self.encoding = encoding
+
+        self._buffer: List[bytes] = []
+        self._buffered = 0
+        self._stream = open(self.baseFilename, 'ab')
+        self._size = self._stream.tell()
+        self._opened_at = time.time()
+        self._last_flush = time.monotonic()
+        self._compressor: Optional[ThreadPoolExecutor] = None
+
+        self._stopped = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        if flush_interval > 0:
+            self._flusher = threading.Thread(
+                target=self._flush_periodically, name='BufferedLogFlusher', daemon=True
+            )
+            self._flusher.start()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            message = self.format(record)
+            if isinstance(message, str):
+                message = (message + '\n').encode(self.encoding)
+            self._buffer.append(message)
+            self._buffered += len(message)
+            if (self._buffered >= self.buffer_size or
+                    (self.flush_interval > 0 and
+                     time.monotonic() - self._last_flush >= self.flush_interval)):
+                self._write_buffer()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            self._write_buffer()
+        finally:
+            self.release()
+
+    def _flush_periodically(self) -> None:
+        while not self._stopped.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception:
+                pass
+
+    def _write_buffer(self) -> None:
+        """Write all buffered records in one call (lock must be held)"""
+        if not self._buffer or self._stream is None:
+            return
+
+        data = b''.join(self._buffer)
+        self._buffer.clear()
+        self._buffered = 0
+
+        if self._should_rotate(len(data)):
+            self._rotate()
+
+        self._stream.write(data)
+        self._stream.flush()
+        self._size += len(data)
+        self._last_flush = time.monotonic()
+
+    def _should_rotate(self, incoming: int) -> bool:
+        if self._size == 0:
+            return False
+        if self.max_bytes and self._size + incoming > self.max_bytes:
+            return True
+        return bool(self.rotate_interval) and time.time() - self._opened_at >= self.rotate_interval
+
+    def _rotate(self) -> None:
+        """Move the current file aside and start a new one"""
+        self._stream.close()
+
+        stamp = time.strftime('%Y%m%d-%H%M%S')
+        rotated = f"{self.baseFilename}.{stamp}"
+        counter = 1
+        while os.path.exists(rotated) or os.path.exists(rotated + '.gz'):
+            rotated = f"{self.baseFilename}.{stamp}.{counter}"
+            counter += 1
+        os.replace(self.baseFilename, rotated)
+
+        self._stream = open(self.baseFilename, 'ab')
+        self._size = 0
+        self._opened_at = time.time()
+
+        if self.compress:
+            if self._compressor is None:
+                self._compressor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix='LogCompressor'
+                )
+            self._compressor.submit(self._compress_and_prune, rotated)
+        else:
+            self._prune()
+
+    def _compress_and_prune(self, path: str) -> None:
+        try:
+            with open(path, 'rb') as src, gzip.open(path + '.gz', 'wb') as dst:
+                shutil.copyfileobj(src, dst)
+            os.remove(path)
+        except OSError:
+            pass
+        self._prune()
+
+    def _prune(self) -> None:
+        """Delete the oldest rotated segments beyond backup_count"""
+        if self.backup_count <= 0:
+            return
+
+        directory, base = os.path.split(self.baseFilename)
+        prefix = base + '.'
+        segments = sorted(
+            (name for name in os.listdir(directory) if name.startswith(prefix)),
+            key=lambda name: os.path.getmtime(os.path.join(directory, name))
+        )
+        for name in segments[:-self.backup_count]:
+            try:
+                os.remove(os.path.join(directory, name))
+            except OSError:
+                pass
+
+    def close(self) -> None:
+        self._stopped.set()
+        self.acquire()
+        try:
+            if self._stream is not None:
+                self._write_buffer()
+                self._stream.close()
+                self._stream = None
+        finally:
+            self.release()
+
+        if self._compressor is not None:
+            self._compressor.shutdown(wait=True)
+            self._compressor = None
+        super().close()
+
+
+def acquire_file_handler(path: str, factory: Callable[[], logging.Handler],
+                         settings: Tuple = (),
+                         replacing: Optional[logging.Handler] = None) -> logging.Handler:
+    """
+    Get the shared file handler for a path, creating it on first use.
+
+    All users of the same path write through one handler, so a file is never
+    written by two handlers and records are never duplicated.
+
+    Args:
+        path: Log file path
+        factory: Creates the handler if a new one is needed
+        settings: Settings the handler was built with (format, buffering,
+            rotation); users of one path must agree on them
+        replacing: The caller's current handler, which it releases after
+            switching to the returned one. If the caller is its only user, a
+            new handler with the new settings is always built.
+
+    Returns:
+        logging.Handler: The shared handler
+
+    Raises:
+        ValueError: If other users hold the path with different settings
+    """
+    _forget_inherited_handlers()
+    key = os.path.abspath(path)
+    with _shared_lock:
+        entry = _shared_file_handlers.get(key)
+        if entry is not None and entry[0] is replacing and entry[1] == 1:
+            # Sole user reconfiguring: the old handler is released separately
+            entry = None
+        elif entry is not None and entry[2] != settings:
+            raise ValueError(
+                f"Log file {path} is already in use with different settings"
+            )
+
+        if entry is None:
+            entry = [factory(), 0, settings]
+            _shared_file_handlers[key] = entry
+        entry[1] += 1
+        return entry[0]
+
+
+def release_file_handler(handler: logging.Handler) -> bool:
+    """
+    Release a handler from acquire_file_handler, closing it after its last user.
+
+    Returns:
+        bool: True if the handler was closed, False if others still use it
+    """
+    _forget_inherited_handlers()
+    key = getattr(handler, 'baseFilename', None)
+    with _shared_lock:
+        entry = _shared_file_handlers.get(key)
+        if entry is None or entry[0] is not handler:
+            handler.close()
+            return True
+        entry[1] -= 1
+        if entry[1] > 0:
+            return False
+        del _shared_file_handlers[key]
+    handler.close()
+    return True
+
+
+def _forget_inherited_handlers() -> None:
+    """
+    Drop the shared handlers inherited through fork().
+
+    They write through the parent's open files and may hold records the
+    parent buffered, so the child closes them without writing anything and
+    starts with an empty registry.
+    """
+    global _shared_lock, _shared_pid
+    if os.getpid() == _shared_pid:
+        return
+
+    _shared_pid = os.getpid()
+    _shared_lock = threading.Lock()
+    for handler, _, _ in _shared_file_handlers.values():
+        if isinstance(handler, BufferedRotatingFileHandler):
+            handler._buffer.clear()
+            handler._buffered = 0
+        handler.close()
+    _shared_file_handlers.clear()
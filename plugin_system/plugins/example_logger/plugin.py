@@ -3,20 +3,56 @@
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterator
 
 from plugin_system.core.plugin import Plugin, PluginMetadata
+from plugin_system.plugins.example_logger.handlers import (
+    OVERFLOW_POLICIES,
+    BufferedRotatingFileHandler,
+    acquire_file_handler,
+    new_logger_name,
+    release_file_handler,
+    start_queue_logging,
+)
+from plugin_system.plugins.example_logger.structured import (
+    LOG_FORMATS,
+    BinaryFormatter,
+    ContextFormatter,
+    NDJSONFormatter,
+    read_log,
+)
+
+
+_LEVELS = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'WARN': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL,
+}
 
 
 class LoggerPlugin(Plugin):
     """
     Example plugin that logs messages to file and console.
+
+    Every instance logs through its own named logger. File handlers are
+    shared between instances writing to the same path, and initialize() or
+    reconfigure() replace this instance's handlers instead of stacking them.
     """
 
     def __init__(self):
         super().__init__()
         self.log_file = None
         self.logger = None
+        self.log_format = 'text'
+        self.logger_name = new_logger_name('LoggerPlugin')
+        self._config: Dict[str, Any] = {}
+        self._file_handler = None
+        self._console_handler = None
+        self._queue_handler = None
+        self._listener = None
 
     def get_metadata(self) -> PluginMetadata:
         return PluginMetadata(
@@ -30,50 +66,200 @@ class LoggerPlugin(Plugin):
         """
         Initialize the logger plugin.
 
+        Calling it again replaces the handlers of the previous configuration.
+
         Config options:
             - log_file: Path to log file (default: logs/plugin.log)
             - log_level: Logging level (default: INFO)
+            - logger_name: Name of this instance's logger
+              (default: LoggerPlugin.<n>, unique per instance)
+            - async_logging: Write records on a background thread (default: False)
+            - queue_size: Maximum queued records in async mode (default: 10000)
+            - overflow_policy: 'block', 'drop_oldest' or 'sample' when the
+              queue is full (default: block)
+            - sample_rate: Keep one in this many overflowing records with the
+              'sample' policy (default: 10)
+            - buffered: Batch file writes and enable rotation (default: False)
+            - buffer_size: Bytes buffered before a write (default: 65536)
+            - flush_interval: Maximum seconds a record stays buffered, 0 to
+              flush only when the buffer is full (default: 1.0)
+            - max_bytes: Rotate the log file at this size (default: 0, disabled)
+            - rotate_interval: Rotate the log file after this many seconds
+              (default: 0, disabled)
+            - backup_count: Rotated files to keep (default: 0, keep all)
+            - compress_rotated: Gzip rotated files in the background (default: False)
+            - log_format: 'text', 'ndjson' or 'binary' file format (default: text).
+              Structured formats keep the context as fields; 'binary' always
+              uses the buffered writer.
         """
         config = config or {}
 
         try:
-            log_file = config.get('log_file', 'logs/plugin.log')
-            log_level = config.get('log_level', 'INFO')
+            self._configure(config)
+            self.logger.info("Logger Plugin initialized")
+            return True
 
-            # Create log directory if needed
-            log_path = Path(log_file)
-            log_path.parent.mkdir(parents=True, exist_ok=True)
+        except Exception as e:
+            print(f"Failed to initialize Logger Plugin: {e}")
+            return False
 
-            self.log_file = log_file
+    def reconfigure(self, config: Dict[str, Any]) -> bool:
+        """
+        Change the configuration of a running logger.
 
-            # Setup logger
-            self.logger = logging.getLogger('LoggerPlugin')
-            self.logger.setLevel(getattr(logging, log_level))
+        The given options are merged into the current configuration. A level
+        change is applied in place; other changes swap in new handlers. File
+        settings (format, buffering, rotation) cannot be changed while other
+        instances share the log file; the configuration is then left as is.
 
-            # File handler
-            fh = logging.FileHandler(self.log_file)
-            fh.setLevel(getattr(logging, log_level))
+        Args:
+            config: Options to change (see initialize())
 
-            # Console handler
-            ch = logging.StreamHandler()
-            ch.setLevel(getattr(logging, log_level))
+        Returns:
+            bool: True if the new configuration was applied
+        """
+        merged = {**self._config, **config}
 
-            # Formatter
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-            fh.setFormatter(formatter)
-            ch.setFormatter(formatter)
+        try:
+            if self.logger and set(config) <= {'log_level'}:
+                self.logger.setLevel(getattr(logging, merged.get('log_level', 'INFO')))
+                self._config = merged
+            else:
+                self._configure(merged)
+            return True
+
+        except Exception as e:
+            print(f"Failed to reconfigure Logger Plugin: {e}")
+            return False
+
+    def _configure(self, config: Dict[str, Any]) -> None:
+        """Build handlers for a configuration and swap them in"""
+        log_file = config.get('log_file', 'logs/plugin.log')
+        log_level = getattr(logging, config.get('log_level', 'INFO'))
+        overflow_policy = config.get('overflow_policy', 'block')
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow_policy}")
+        log_format = config.get('log_format', 'text')
+        if log_format not in LOG_FORMATS:
+            raise ValueError(f"Unknown log format: {log_format}")
+
+        # Create log directory if needed
+        log_path = Path(log_file)
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Shared file handler; acquired before the old one is released so a
+        # failure (e.g. conflicting settings) leaves the old setup in place
+        fh = acquire_file_handler(
+            log_file,
+            lambda: self._create_file_handler(log_file, log_format, config),
+            settings=self._file_settings(log_format, config),
+            replacing=self._file_handler
+        )
 
+        # Console handler
+        ch = logging.StreamHandler()
+        text_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        if log_format == 'text':
+            ch.setFormatter(logging.Formatter(text_format))
+        else:
+            ch.setFormatter(ContextFormatter(text_format))
+
+        self._teardown_handlers()
+
+        self.log_file = log_file
+        self.log_format = log_format
+        self._file_handler = fh
+        self._console_handler = ch
+        self._config = config
+
+        # Setup logger
+        self.logger = logging.getLogger(config.get('logger_name', self.logger_name))
+        self.logger.setLevel(log_level)
+
+        if config.get('async_logging', False):
+            self._queue_handler, self._listener = start_queue_logging(
+                [fh, ch],
+                queue_size=config.get('queue_size', 10000),
+                overflow_policy=overflow_policy,
+                sample_rate=config.get('sample_rate', 10)
+            )
+            self.logger.addHandler(self._queue_handler)
+        else:
             self.logger.addHandler(fh)
             self.logger.addHandler(ch)
 
-            self.logger.info("Logger Plugin initialized")
-            return True
+    def _file_settings(self, log_format: str, config: Dict[str, Any]) -> tuple:
+        """Options that determine how a file handler is built"""
+        if config.get('buffered', False) or log_format == 'binary':
+            return (
+                log_format, True,
+                config.get('buffer_size', 64 * 1024),
+                config.get('flush_interval', 1.0),
+                config.get('max_bytes', 0),
+                config.get('rotate_interval', 0),
+                config.get('backup_count', 0),
+                config.get('compress_rotated', False)
+            )
+        return (log_format, False)
 
-        except Exception as e:
-            print(f"Failed to initialize Logger Plugin: {e}")
-            return False
+    def _create_file_handler(self, log_file: str, log_format: str,
+                             config: Dict[str, Any]) -> logging.Handler:
+        """Create a file handler; filtering is left to the owning loggers"""
+        if config.get('buffered', False) or log_format == 'binary':
+            fh = BufferedRotatingFileHandler(
+                log_file,
+                buffer_size=config.get('buffer_size', 64 * 1024),
+                flush_interval=config.get('flush_interval', 1.0),
+                max_bytes=config.get('max_bytes', 0),
+                rotate_interval=config.get('rotate_interval', 0),
+                backup_count=config.get('backup_count', 0),
+                compress=config.get('compress_rotated', False)
+            )
+        else:
+            fh = logging.FileHandler(log_file)
+
+        # Formatter
+        if log_format == 'text':
+            fh.setFormatter(logging.Formatter(
+                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+            ))
+        elif log_format == 'ndjson':
+            fh.setFormatter(NDJSONFormatter())
+        else:
+            fh.setFormatter(BinaryFormatter())
+        return fh
+
+    def _teardown_handlers(self) -> None:
+        """
+        Detach and release the handlers of the current configuration.
+
+        A shared file handler stays attached to a logger set via the
+        'logger_name' option while other instances still use it, since that
+        logger may be theirs as well.
+        """
+        if self._listener is not None:
+            # Stopping the listener writes out everything still queued
+            self._listener.stop()
+            self._listener = None
+
+        released = True
+        if self._file_handler is not None:
+            released = release_file_handler(self._file_handler)
+
+        if self.logger:
+            owned = self.logger.name == self.logger_name
+            for handler in (self._queue_handler, self._console_handler):
+                if handler is not None:
+                    self.logger.removeHandler(handler)
+            if self._file_handler is not None and (owned or released):
+                self.logger.removeHandler(self._file_handler)
+
+        if self._console_handler is not None:
+            self._console_handler.close()
+
+        self._queue_handler = None
+        self._file_handler = None
+        self._console_handler = None
 
     def execute(self, message: str, level: str = "INFO", **kwargs) -> Any:
         """
@@ -90,12 +276,30 @@ class LoggerPlugin(Plugin):
         if not self.logger:
             raise RuntimeError("Logger not initialized")
 
-        log_method = getattr(self.logger, level.lower(), self.logger.info)
+        levelno = _LEVELS.get(level.upper(), logging.INFO)
+        if not self.logger.isEnabledFor(levelno):
+            # Filtered out: skip formatting the context and the timestamp
+            return {
+                'timestamp': None,
+                'level': level,
+                'message': message,
+                'logged_to': None
+            }
+
+        if self.log_format != 'text':
+            self.logger.log(levelno, message, extra={'context': kwargs})
+            return {
+                'timestamp': datetime.now().isoformat(),
+                'level': level,
+                'message': message,
+                'context': kwargs,
+                'logged_to': self.log_file
+            }
 
         if kwargs:
             message = f"{message} | Context: {kwargs}"
 
-        log_method(message)
+        self.logger.log(levelno, message)
 
         return {
             'timestamp': datetime.now().isoformat(),
@@ -104,10 +308,51 @@ class LoggerPlugin(Plugin):
             'logged_to': self.log_file
         }
 
+    def read_logs(self, min_level: Any = None, since: float = None,
+                  until: float = None, **fields) -> Iterator[Dict[str, Any]]:
+        """
+        Stream entries of this plugin's structured log file.
+
+        Args:
+            min_level: Minimum level name or number
+            since: Only entries at or after this UNIX timestamp
+            until: Only entries at or before this UNIX timestamp
+            **fields: Only entries whose context has these field values
+
+        Returns:
+            Iterator of log entries
+        """
+        if self.log_format == 'text':
+            raise RuntimeError("read_logs requires the 'ndjson' or 'binary' log format")
+        self.flush()
+        return read_log(self.log_file, self.log_format, min_level, since, until, fields)
+
+    def flush(self) -> None:
+        """Wait until all queued records are written and flush the handlers"""
+        if self._listener is not None:
+            self._listener.queue.join()
+        for handler in (self._file_handler, self._console_handler):
+            if handler is not None:
+                handler.flush()
+
+    def after_fork(self) -> None:
+        """Open this process's own log handlers in a forked worker"""
+        if self.logger is None:
+            return
+
+        # The inherited handlers are closed by the shared handler registry;
+        # the queue writer thread did not survive the fork
+        for handler in (self._queue_handler, self._file_handler, self._console_handler):
+            if handler is not None:
+                self.logger.removeHandler(handler)
+        self._queue_handler = None
+        self._listener = None
+        self._file_handler = None
+        self._console_handler = None
+
+        self._configure(self._config)
+
     def shutdown(self) -> None:
         """Clean up logger resources"""
-        if self.logger:
-            for handler in self.logger.handlers[:]:
-                handler.close()
-                self.logger.removeHandler(handler)
+        self._teardown_handlers()
         super().shutdown()
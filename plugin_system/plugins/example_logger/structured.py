@@ -0,0 +1,158 @@
+"""Structured (NDJSON and binary) log formats for the logger plugin"""
+
+import json
+import logging
+import re
+import struct
+from typing import Any, Dict, Iterator, Optional
+
+
+# Supported values of the logger plugin's 'log_format' option
+LOG_FORMATS = ('text', 'ndjson', 'binary')
+
+# Binary record header: payload length, timestamp, level number
+_HEADER = struct.Struct('<IdB')
+
+# NDJSON records start with timestamp and level so readers can filter cheaply
+_NDJSON_PREFIX = re.compile(r'^\{"ts":([-0-9.eE+]+),"lvl":(\d+),')
+
+
+def _record_fields(record: logging.LogRecord) -> Dict[str, Any]:
+    """Fields of a record that are not covered by the timestamp/level header"""
+    fields = {
+        'level': record.levelname,
+        'logger': record.name,
+        'msg': record.getMessage(),
+        'ctx': getattr(record, 'context', None) or {}
+    }
+    if record.exc_info:
+        fields['exc'] = logging.Formatter().formatException(record.exc_info)
+    return fields
+
+
+class ContextFormatter(logging.Formatter):
+    """Text formatter that appends the structured context of a record"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = super().format(record)
+        context = getattr(record, 'context', None)
+        if context:
+            message = f"{message} | Context: {context}"
+        return message
+
+
+class NDJSONFormatter(logging.Formatter):
+    """Formats records as one compact JSON object per line"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        document = {'ts': record.created, 'lvl': record.levelno}
+        document.update(_record_fields(record))
+        return json.dumps(document, separators=(',', ':'), default=str)
+
+
+class BinaryFormatter(logging.Formatter):
+    """
+    Formats records as length-prefixed binary records.
+
+    Each record is a fixed header (payload length, timestamp, level number)
+    followed by a compact JSON payload, so readers can skip records by level
+    or time without decoding the payload.
+    """
+
+    def format(self, record: logging.LogRecord) -> bytes:
+        payload = json.dumps(
+            _record_fields(record), separators=(',', ':'), default=str
+        ).encode('utf-8')
+        return _HEADER.pack(len(payload), record.created, record.levelno) + payload
+
+
+def _matches_fields(entry: Dict[str, Any], fields: Optional[Dict[str, Any]]) -> bool:
+    if not fields:
+        return True
+    context = entry.get('ctx') or {}
+    return all(context.get(name) == value for name, value in fields.items())
+
+
+def _in_range(timestamp: float, levelno: int, min_level: int,
+              since: Optional[float], until: Optional[float]) -> bool:
+    if levelno < min_level:
+        return False
+    if since is not None and timestamp < since:
+        return False
+    if until is not None and timestamp > until:
+        return False
+    return True
+
+
+def read_log(path: str, log_format: str = 'ndjson', min_level: Any = None,
+             since: Optional[float] = None, until: Optional[float] = None,
+             fields: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Stream entries of a structured log file, filtered by level, time and context.
+
+    Level and time filters are applied before a record's payload is decoded.
+
+    Args:
+        path: Log file written with the 'ndjson' or 'binary' format
+        log_format: 'ndjson' or 'binary'
+        min_level: Minimum level name or number
+        since: Only entries at or after this UNIX timestamp
+        until: Only entries at or before this UNIX timestamp
+        fields: Only entries whose context has these field values
+
+    Returns:
+        Iterator of entries with 'ts', 'lvl', 'level', 'logger', 'msg' and 'ctx'
+    """
+    if isinstance(min_level, str):
+        min_level = logging.getLevelName(min_level.upper())
+    min_level = min_level or 0
+
+    if log_format == 'ndjson':
+        return _read_ndjson(path, min_level, since, until, fields)
+    if log_format == 'binary':
+        return _read_binary(path, min_level, since, until, fields)
+    raise ValueError(f"Unknown structured log format: {log_format}")
+
+
+def _read_ndjson(path: str, min_level: int, since: Optional[float],
+                 until: Optional[float], fields: Optional[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            prefix = _NDJSON_PREFIX.match(line)
+            if prefix is not None:
+                if not _in_range(float(prefix.group(1)), int(prefix.group(2)),
+                                 min_level, since, until):
+                    continue
+                entry = json.loads(line)
+            elif line.startswith('{'):
+                entry = json.loads(line)
+                if not _in_range(entry.get('ts', 0), entry.get('lvl', 0),
+                                 min_level, since, until):
+                    continue
+            else:
+                # Blank lines, or text records written before the log
+                # format was switched to ndjson
+                continue
+
+            if _matches_fields(entry, fields):
+                yield entry
+
+
+def _read_binary(path: str, min_level: int, since: Optional[float],
+                 until: Optional[float], fields: Optional[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    header_size = _HEADER.size
+    with open(path, 'rb') as f:
+        while True:
+            header = f.read(header_size)
+            if len(header) < header_size:
+                return
+
+            length, timestamp, levelno = _HEADER.unpack(header)
+            if not _in_range(timestamp, levelno, min_level, since, until):
+                f.seek(length, 1)
+                continue
+
+            entry = {'ts': timestamp, 'lvl': levelno}
+            entry.update(json.loads(f.read(length)))
+            if _matches_fields(entry, fields):
+                yield entry
@@ -0,0 +1,176 @@
+"""JSON codec used by the transformer plugin"""
+
+import json
+from typing import IO, Any, Iterable, Iterator, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+JSON_BACKENDS = ('auto', 'json', 'orjson')
+
+
+class JsonCodec:
+    """
+    JSON encoder/decoder with compact, bytes, streaming and NDJSON support.
+
+    Uses the standard library json module by default. Backend 'orjson' (or
+    'auto' when orjson is installed) is faster but not identical: output is
+    not ASCII-escaped, NaN/Infinity encode as null and integers beyond 64
+    bits decode as floats. Values orjson cannot encode (e.g. non-string dict
+    keys) and documents it rejects (e.g. NaN literals) fall back to json.
+    """
+
+    def __init__(self, backend: str = 'json'):
+        """
+        Initialize the codec.
+
+        Args:
+            backend: 'json' (default), 'orjson', or 'auto' for orjson when installed
+
+        Raises:
+            ValueError: If the backend is unknown or not installed
+        """
+        if backend not in JSON_BACKENDS:
+            raise ValueError(f"Unknown JSON backend: {backend}")
+        if backend == 'orjson' and orjson is None:
+            raise ValueError("JSON backend 'orjson' is not installed")
+
+        self.backend = 'orjson' if backend != 'json' and orjson is not None else 'json'
+        self._fast = self.backend == 'orjson'
+
+    def encode_bytes(self, data: Any, compact: bool = False) -> bytes:
+        """
+        Encode data as UTF-8 JSON bytes.
+
+        Args:
+            data: Data to encode
+            compact: Omit indentation and whitespace
+
+        Returns:
+            bytes: Encoded JSON
+        """
+        if self._fast:
+            try:
+                return orjson.dumps(data, option=0 if compact else orjson.OPT_INDENT_2)
+            except TypeError:
+                pass
+        return self._encode_std(data, compact).encode('utf-8')
+
+    def encode(self, data: Any, compact: bool = False) -> str:
+        """
+        Encode data as a JSON string.
+
+        Args:
+            data: Data to encode
+            compact: Omit indentation and whitespace
+
+        Returns:
+            str: Encoded JSON
+        """
+        if self._fast:
+            try:
+                return orjson.dumps(
+                    data, option=0 if compact else orjson.OPT_INDENT_2
+                ).decode('utf-8')
+            except TypeError:
+                pass
+        return self._encode_std(data, compact)
+
+    def _encode_std(self, data: Any, compact: bool) -> str:
+        if compact:
+            return json.dumps(data, separators=(',', ':'))
+        return json.dumps(data, indent=2)
+
+    def dump(self, data: Any, fp: IO, compact: bool = False) -> None:
+        """
+        Encode data into a file-like object.
+
+        With the json backend the document is written incrementally in
+        chunks instead of being built as one string first.
+
+        Args:
+            data: Data to encode
+            fp: Text or binary file-like object
+            compact: Omit indentation and whitespace
+        """
+        binary = _is_binary(fp)
+        if self._fast:
+            try:
+                encoded = orjson.dumps(data, option=0 if compact else orjson.OPT_INDENT_2)
+                fp.write(encoded if binary else encoded.decode('utf-8'))
+                return
+            except TypeError:
+                pass
+
+        if compact:
+            encoder = json.JSONEncoder(separators=(',', ':'))
+        else:
+            encoder = json.JSONEncoder(indent=2)
+        for chunk in encoder.iterencode(data):
+            fp.write(chunk.encode('utf-8') if binary else chunk)
+
+    def decode(self, data: Union[str, bytes, bytearray, IO]) -> Any:
+        """
+        Decode JSON from a string, bytes or a file-like object.
+
+        Args:
+            data: JSON document or readable file-like object
+
+        Returns:
+            Decoded data
+        """
+        if hasattr(data, 'read'):
+            data = data.read()
+        if self._fast:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
+        return json.loads(data)
+
+    def write_ndjson(self, records: Iterable[Any], fp: IO) -> int:
+        """
+        Write records as newline-delimited JSON, one compact document per line.
+
+        Args:
+            records: Iterable of records
+            fp: Text or binary file-like object
+
+        Returns:
+            int: Number of records written
+        """
+        binary = _is_binary(fp)
+        count = 0
+        for record in records:
+            if binary:
+                fp.write(self.encode_bytes(record, compact=True) + b'\n')
+            else:
+                fp.write(self.encode(record, compact=True) + '\n')
+            count += 1
+        return count
+
+    def read_ndjson(self, lines: Union[IO, Iterable[Union[str, bytes]]]) -> Iterator[Any]:
+        """
+        Lazily read newline-delimited JSON records.
+
+        Args:
+            lines: File-like object or iterable of lines; blank lines are skipped
+
+        Returns:
+            Iterator over the decoded records
+        """
+        loads = self.decode if self._fast else json.loads
+        for line in lines:
+            if line.strip():
+                yield loads(line)
+
+
+def _is_binary(fp: IO) -> bool:
+    """Check whether a file-like object expects bytes"""
+    mode: Optional[str] = getattr(fp, 'mode', None)
+    if isinstance(mode, str):
+        return 'b' in mode
+    return not hasattr(fp, 'encoding')
@@ -0,0 +1,29 @@
+"""Chunk functions run on the transformer plugin's worker pools
+
+They live in their own module because plugin.py is imported by the plugin
+manager under a synthetic module name (plugins.<name>) that worker
+processes cannot import; this module is always importable by its real name.
+"""
+
+from typing import Callable, List, Optional, Tuple
+
+
+def map_chunk(func: Callable, chunk: List) -> List:
+    """Map a chunk of items"""
+    return [func(item) for item in chunk]
+
+
+def filter_chunk(func: Callable, chunk: List) -> List:
+    """Filter a chunk of items"""
+    return [item for item in chunk if func(item)]
+
+
+def fused_chunk(steps: Tuple[Tuple[str, Optional[Callable]], ...], chunk: List) -> List:
+    """Apply adjacent filter/map steps to a chunk of items in one pass"""
+    items = iter(chunk)
+    for operation, func in steps:
+        if operation == 'filter':
+            items = filter(func, items)
+        elif func is not None:
+            items = map(func, items)
+    return list(items)
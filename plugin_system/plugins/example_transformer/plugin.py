@@ -1,9 +1,98 @@
 """Data transformer plugin implementation"""
 
-import json
-from typing import Any, Dict, List
+import heapq
+import os
+import pickle
+import tempfile
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 from plugin_system.core.plugin import Plugin, PluginMetadata
+from plugin_system.plugins.example_transformer.codec import JSON_BACKENDS, JsonCodec
+from plugin_system.plugins.example_transformer.parallel import filter_chunk, fused_chunk, map_chunk
+
+
+# Operations that act on each list item independently and can share one pass
+ELEMENTWISE_OPERATIONS = ('filter', 'map')
+
+# Operations that can be applied lazily to a stream of items
+STREAMING_OPERATIONS = ('uppercase', 'lowercase', 'filter', 'map', 'flatten', 'sort')
+
+# Execution backends for map/filter with user callables
+EXECUTION_BACKENDS = ('serial', 'thread', 'process')
+
+# Containers that are flattened; str, bytes and dicts are kept as leaves
+_NESTED_TYPES = (list, tuple)
+_LEAF_TYPES = (str, bytes, bytearray, dict)
+
+
+def _is_nested(item: Any) -> bool:
+    """Check whether flatten should descend into an item"""
+    if isinstance(item, _NESTED_TYPES):
+        return True
+    if isinstance(item, _LEAF_TYPES):
+        return False
+    if isinstance(item, Iterator):
+        # Generators, map/filter objects and other one-shot iterators
+        return True
+    # NumPy-style arrays; 0-d arrays and scalars are leaves
+    return getattr(item, 'ndim', 0) > 0 and hasattr(item, '__iter__')
+
+
+def _flatten_iterator(items: Iterator, max_depth: Optional[int] = None) -> Iterator:
+    """Flatten an iterator using an explicit stack instead of recursion"""
+    stack = [items]
+    while stack:
+        for item in stack[-1]:
+            if (max_depth is None or len(stack) <= max_depth) and _is_nested(item):
+                stack.append(iter(item))
+                break
+            yield item
+        else:
+            stack.pop()
+
+
+def _read_run(run) -> Iterator:
+    """Read back the items of a spilled sort run"""
+    run.seek(0)
+    load = pickle.load
+    while True:
+        try:
+            yield load(run)
+        except EOFError:
+            return
+
+
+class TransformPipeline:
+    """
+    A reusable, pre-resolved chain of transformer operations.
+
+    Built by TransformerPlugin.compile_pipeline(). Every step is bound to its
+    handler once, and runs of adjacent element-wise steps are fused into a
+    single pass over the list, so no intermediate lists are built. Large
+    lists run the fused pass on the plugin's execution backend.
+    """
+
+    def __init__(self, stages: List[Callable[[Any], Any]], operations: List[str]):
+        self._stages = tuple(stages)
+        self.operations = tuple(operations)
+
+    def __call__(self, data: Any) -> Any:
+        for stage in self._stages:
+            data = stage(data)
+        return data
+
+    def run(self, data: Any) -> Any:
+        """Run the pipeline on data"""
+        return self(data)
+
+    def __len__(self) -> int:
+        return len(self._stages)
+
+    def __repr__(self) -> str:
+        return f"TransformPipeline({' -> '.join(self.operations)})"
 
 
 class TransformerPlugin(Plugin):
@@ -14,6 +103,26 @@ class TransformerPlugin(Plugin):
     def __init__(self):
         super().__init__()
         self.transformations = []
+        self.pipelines: Dict[str, TransformPipeline] = {}
+        self.execution_backend = 'serial'
+        self.max_workers: Optional[int] = None
+        self.chunk_size: Optional[int] = None
+        self.parallel_threshold = 10000
+        self.sort_memory_items = 1000000
+        self.sort_spill_dir: Optional[str] = None
+        self._executors: Dict[str, Executor] = {}
+        self.codec = JsonCodec()
+        self._operations: Dict[str, Callable[..., Any]] = {
+            'uppercase': self._to_uppercase,
+            'lowercase': self._to_lowercase,
+            'reverse': self._reverse,
+            'filter': self._filter_data,
+            'map': self._map_data,
+            'flatten': self._flatten,
+            'to_json': self._to_json,
+            'from_json': self._from_json,
+            'sort': self._sort_data,
+        }
 
     def get_metadata(self) -> PluginMetadata:
         return PluginMetadata(
@@ -28,10 +137,49 @@ class TransformerPlugin(Plugin):
         Initialize the transformer plugin.
 
         Config options:
-            - transformations: List of transformation pipelines to pre-configure
+            - transformations: Mapping of pipeline name to a list of
+              (operation_name, kwargs) steps, compiled once at startup
+            - execution_backend: 'serial', 'thread' or 'process' for map/filter
+              with a callable (default: serial)
+            - max_workers: Worker count for parallel backends (default: CPU count)
+            - chunk_size: Items per parallel task (default: derived from size)
+            - parallel_threshold: Minimum list size to run in parallel (default: 10000)
+            - sort_memory_items: Items sorted in memory before streaming sorts
+              spill runs to disk (default: 1000000)
+            - sort_spill_dir: Directory for spilled sort runs (default: system temp)
+            - json_backend: 'json', 'orjson' or 'auto' (default: json; 'auto'
+              uses orjson when installed, see JsonCodec for the differences)
         """
         config = config or {}
         self.transformations = config.get('transformations', [])
+
+        backend = config.get('execution_backend', 'serial')
+        if backend not in EXECUTION_BACKENDS:
+            return False
+        self.execution_backend = backend
+        max_workers = config.get('max_workers')
+        if max_workers != self.max_workers:
+            # Pools are sized on creation; build new ones on next use
+            self._shutdown_executors(wait=False)
+        self.max_workers = max_workers
+        self.chunk_size = config.get('chunk_size')
+        self.parallel_threshold = config.get('parallel_threshold', 10000)
+        self.sort_memory_items = config.get('sort_memory_items', 1000000)
+        self.sort_spill_dir = config.get('sort_spill_dir')
+
+        json_backend = config.get('json_backend', 'json')
+        if json_backend not in JSON_BACKENDS:
+            return False
+        try:
+            self.codec = JsonCodec(json_backend)
+        except ValueError:
+            return False
+        self.pipelines = {}
+
+        if isinstance(self.transformations, dict):
+            for name, operations in self.transformations.items():
+                self.pipelines[name] = self.compile_pipeline(operations)
+
         return True
 
     def execute(self, data: Any, operation: str, **kwargs) -> Any:
@@ -46,36 +194,44 @@ class TransformerPlugin(Plugin):
         Returns:
             Transformed data
         """
-        if operation == 'uppercase':
-            return self._to_uppercase(data)
-        elif operation == 'lowercase':
-            return self._to_lowercase(data)
-        elif operation == 'reverse':
-            return self._reverse(data)
-        elif operation == 'filter':
-            return self._filter_data(data, **kwargs)
-        elif operation == 'map':
-            return self._map_data(data, **kwargs)
-        elif operation == 'flatten':
-            return self._flatten(data)
-        elif operation == 'to_json':
-            return self._to_json(data)
-        elif operation == 'from_json':
-            return self._from_json(data)
-        elif operation == 'sort':
-            return self._sort_data(data, **kwargs)
-        else:
+        handler = self._operations.get(operation)
+        if handler is None:
             raise ValueError(f"Unknown operation: {operation}")
+        return handler(data, **kwargs)
+
+    def register_operation(self, name: str, handler: Callable[..., Any] = None) -> Any:
+        """
+        Register (or replace) an operation.
+
+        Can be called directly or used as a decorator. The handler is called
+        as handler(data, **kwargs) and its result is returned by execute().
+        Pipelines compiled before the registration keep their old handler.
 
-    def _to_uppercase(self, data: Any) -> str:
+        Args:
+            name: Operation name
+            handler: Callable implementing the operation
+
+        Returns:
+            The handler, or a decorator when no handler is given
+        """
+        if handler is None:
+            return lambda func: self.register_operation(name, func)
+        self._operations[name] = handler
+        return handler
+
+    def list_operations(self) -> List[str]:
+        """List all registered operation names"""
+        return list(self._operations.keys())
+
+    def _to_uppercase(self, data: Any, **kwargs) -> str:
         """Convert to uppercase"""
         return str(data).upper()
 
-    def _to_lowercase(self, data: Any) -> str:
+    def _to_lowercase(self, data: Any, **kwargs) -> str:
         """Convert to lowercase"""
         return str(data).lower()
 
-    def _reverse(self, data: Any) -> Any:
+    def _reverse(self, data: Any, **kwargs) -> Any:
         """Reverse data (string or list)"""
         if isinstance(data, str):
             return data[::-1]
@@ -90,6 +246,9 @@ class TransformerPlugin(Plugin):
             return data
 
         if condition:
+            backend = kwargs.get('backend', self.execution_backend)
+            if backend != 'serial' and len(data) >= self.parallel_threshold:
+                return self._run_parallel(filter_chunk, condition, data, backend)
             return [item for item in data if condition(item)]
 
         # Default: filter out None and empty values
@@ -101,45 +260,311 @@ class TransformerPlugin(Plugin):
             return data
 
         if transform:
+            backend = kwargs.get('backend', self.execution_backend)
+            if backend != 'serial' and len(data) >= self.parallel_threshold:
+                return self._run_parallel(map_chunk, transform, data, backend)
             return [transform(item) for item in data]
 
         return data
 
-    def _flatten(self, data: Any) -> List:
-        """Flatten nested lists"""
+    def _run_fused(self, steps: Tuple[Tuple[str, Optional[Callable]], ...], data: Any) -> Any:
+        """Run fused filter/map steps, in parallel for large lists"""
         if not isinstance(data, list):
-            return [data]
+            return data
+
+        backend = self.execution_backend
+        if backend != 'serial' and len(data) >= self.parallel_threshold:
+            return self._run_parallel(fused_chunk, steps, data, backend)
+        return fused_chunk(steps, data)
+
+    def _run_parallel(self, chunk_func: Callable, func: Callable, data: List, backend: str) -> List:
+        """
+        Run a map/filter/fused chunk function over data on a worker pool.
 
+        Results are concatenated in input order. The process backend falls
+        back to serial execution when the submitted callable cannot be
+        pickled (e.g. lambdas).
+        """
+        task = partial(chunk_func, func)
+        if backend == 'process':
+            try:
+                pickle.dumps(task)
+            except Exception:
+                return task(data)
+
+        executor = self._get_executor(backend)
+        workers = self.max_workers or os.cpu_count() or 1
+        chunk_size = self.chunk_size or max(1, -(-len(data) // (workers * 4)))
+
+        chunks = [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
         result = []
-        for item in data:
-            if isinstance(item, list):
-                result.extend(self._flatten(item))
-            else:
-                result.append(item)
+        for part in executor.map(task, chunks):
+            result.extend(part)
         return result
 
-    def _to_json(self, data: Any) -> str:
-        """Convert to JSON string"""
-        return json.dumps(data, indent=2)
+    def _get_executor(self, backend: str) -> Executor:
+        """Get (or lazily create) the worker pool of a backend"""
+        executor = self._executors.get(backend)
+        if executor is None:
+            if backend == 'thread':
+                executor = ThreadPoolExecutor(max_workers=self.max_workers)
+            elif backend == 'process':
+                executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                raise ValueError(f"Unknown execution backend: {backend}")
+            self._executors[backend] = executor
+        return executor
+
+    def _shutdown_executors(self, wait: bool = True) -> None:
+        """Shut down and forget the worker pools"""
+        executors, self._executors = self._executors, {}
+        for executor in executors.values():
+            executor.shutdown(wait=wait)
+
+    def after_fork(self) -> None:
+        """Drop the inherited worker pools; their threads and processes belong to the parent"""
+        self._executors = {}
+
+    def shutdown(self) -> None:
+        """Shut down worker pools"""
+        self._shutdown_executors()
+        super().shutdown()
+
+    def _flatten(self, data: Any, max_depth: Optional[int] = None, **kwargs) -> List:
+        """Flatten nested lists, tuples, iterators and arrays"""
+        return list(self.iter_flatten(data, max_depth))
 
-    def _from_json(self, data: str) -> Any:
-        """Parse from JSON string"""
-        return json.loads(data)
+    def iter_flatten(self, data: Any, max_depth: Optional[int] = None) -> Iterator:
+        """
+        Lazily flatten nested data.
+
+        Lists, tuples, iterators (e.g. generators) and NumPy-style arrays are
+        flattened; strings, bytes and dicts are kept as items. An explicit
+        stack is used, so arbitrarily deep nesting does not hit the recursion
+        limit. Non-nested data yields itself.
+
+        Args:
+            data: Data to flatten
+            max_depth: Number of nesting levels to flatten, or None for all
+
+        Returns:
+            Iterator over the flattened items
+        """
+        if not _is_nested(data):
+            return iter((data,))
+        return _flatten_iterator(iter(data), max_depth)
+
+    def _to_json(self, data: Any, compact: bool = False, as_bytes: bool = False, **kwargs) -> Any:
+        """Convert to JSON string (or UTF-8 bytes)"""
+        if as_bytes:
+            return self.codec.encode_bytes(data, compact)
+        return self.codec.encode(data, compact)
 
-    def _sort_data(self, data: List, reverse: bool = False, key: str = None) -> List:
-        """Sort list data"""
+    def _from_json(self, data: Any, **kwargs) -> Any:
+        """Parse from JSON string, bytes or file-like object"""
+        return self.codec.decode(data)
+
+    def dump_json(self, data: Any, fp: IO, compact: bool = False) -> None:
+        """
+        Write data as JSON to a text or binary file-like object.
+
+        Args:
+            data: Data to encode
+            fp: File-like object
+            compact: Omit indentation and whitespace
+        """
+        self.codec.dump(data, fp, compact)
+
+    def write_ndjson(self, records: Iterable[Any], fp: IO) -> int:
+        """
+        Write a stream of records as newline-delimited JSON.
+
+        Args:
+            records: Iterable of records
+            fp: Text or binary file-like object
+
+        Returns:
+            int: Number of records written
+        """
+        return self.codec.write_ndjson(records, fp)
+
+    def read_ndjson(self, lines: Iterable) -> Iterator[Any]:
+        """
+        Lazily read records from newline-delimited JSON.
+
+        Args:
+            lines: File-like object or iterable of lines
+
+        Returns:
+            Iterator over the decoded records
+        """
+        return self.codec.read_ndjson(lines)
+
+    def _sort_data(self, data: List, reverse: bool = False, key: str = None,
+                   keys: Sequence = None, limit: int = None) -> List:
+        """
+        Sort list data.
+
+        Args:
+            data: List to sort
+            reverse: Sort descending
+            key: Dict field to sort dict items by
+            keys: Precomputed sort keys, one per item, used instead of the items
+            limit: Only return the first `limit` items of the sorted result
+        """
         if not isinstance(data, list):
             return data
 
-        if key and all(isinstance(item, dict) for item in data):
-            return sorted(data, key=lambda x: x.get(key, 0), reverse=reverse)
+        if keys is not None:
+            if len(keys) != len(data):
+                raise ValueError("keys must have one entry per item")
+            order = self._sort_list(range(len(data)), keys.__getitem__, reverse, limit)
+            return [data[i] for i in order]
+
+        if key:
+            try:
+                return self._sort_list(data, self._sort_key(key), reverse, limit)
+            except AttributeError:
+                # Not all items are dicts, sort the items themselves
+                pass
 
         try:
-            return sorted(data, reverse=reverse)
+            return self._sort_list(data, None, reverse, limit)
         except TypeError:
             # Can't sort mixed types
             return data
 
+    def _sort_list(self, data: Iterable, key_func: Optional[Callable],
+                   reverse: bool, limit: Optional[int]) -> List:
+        """Full sort, or a partial top-k selection when limit is set"""
+        if limit is not None:
+            select = heapq.nlargest if reverse else heapq.nsmallest
+            return select(limit, data, key=key_func)
+        return sorted(data, key=key_func, reverse=reverse)
+
+    def _sort_key(self, key: Any) -> Optional[Callable]:
+        """Turn a dict field name (or key callable) into a key function"""
+        if key is None or callable(key):
+            return key
+        return lambda item: item.get(key, 0)
+
+    def sort_external(self, data: Iterable, reverse: bool = False, key: Any = None,
+                      limit: int = None, chunk_size: int = None) -> Iterator:
+        """
+        Sort any iterable with bounded memory.
+
+        Up to chunk_size items are sorted in memory. Larger inputs are split
+        into sorted runs that are spilled to temporary files and lazily
+        k-way merged. With a limit, only the top items are kept in memory
+        and nothing is spilled.
+
+        Args:
+            data: Iterable of items to sort
+            reverse: Sort descending
+            key: Dict field name or key callable
+            limit: Only yield the first `limit` items of the sorted result
+            chunk_size: Items per in-memory run (default: sort_memory_items)
+
+        Returns:
+            Iterator over the sorted items
+        """
+        key_func = self._sort_key(key)
+        if limit is not None:
+            return iter(self._sort_list(data, key_func, reverse, limit))
+        return self._external_merge_sort(iter(data), key_func, reverse,
+                                         chunk_size or self.sort_memory_items)
+
+    def _external_merge_sort(self, items: Iterator, key_func: Optional[Callable],
+                             reverse: bool, chunk_size: int) -> Iterator:
+        """Sort runs of chunk_size items, spill them and merge with heapq"""
+        chunk = list(islice(items, chunk_size))
+        runs = []
+        try:
+            while chunk:
+                chunk.sort(key=key_func, reverse=reverse)
+                next_chunk = list(islice(items, chunk_size))
+                if not runs and not next_chunk:
+                    # Everything fits in memory
+                    yield from chunk
+                    return
+                runs.append(self._spill_run(chunk))
+                chunk = next_chunk
+
+            yield from heapq.merge(*[_read_run(run) for run in runs],
+                                   key=key_func, reverse=reverse)
+        finally:
+            for run in runs:
+                run.close()
+
+    def _spill_run(self, chunk: List):
+        """Write a sorted run to an anonymous temporary file"""
+        run = tempfile.TemporaryFile(dir=self.sort_spill_dir)
+        dump = pickle.dump
+        for item in chunk:
+            dump(item, run, pickle.HIGHEST_PROTOCOL)
+        return run
+
+    def stream(self, data: Iterable, operation: str, **kwargs) -> Iterator:
+        """
+        Lazily apply an operation to each item of an iterable.
+
+        Unlike execute(), which needs a materialized list, the result is an
+        iterator that pulls one item at a time from the input, so memory use
+        does not grow with the input size. Consumers control the pace, which
+        gives natural backpressure.
+
+        Args:
+            data: Any iterable or iterator of items
+            operation: One of STREAMING_OPERATIONS
+            **kwargs: 'condition' for filter, 'transform' for map,
+                'max_depth' for flatten, see sort_external() for sort
+
+        Returns:
+            Iterator over the transformed items
+
+        Raises:
+            ValueError: If the operation cannot be streamed
+        """
+        if operation == 'filter':
+            return filter(kwargs.get('condition'), data)
+        elif operation == 'map':
+            transform = kwargs.get('transform')
+            return map(transform, data) if transform else iter(data)
+        elif operation == 'uppercase':
+            return map(self._to_uppercase, data)
+        elif operation == 'lowercase':
+            return map(self._to_lowercase, data)
+        elif operation == 'flatten':
+            return _flatten_iterator(iter(data), kwargs.get('max_depth'))
+        elif operation == 'sort':
+            return self.sort_external(data, **kwargs)
+        else:
+            raise ValueError(f"Operation cannot be streamed: {operation}")
+
+    def stream_chunks(self, data: Iterable, operation: str,
+                      chunk_size: int = 1000, **kwargs) -> Iterator[List]:
+        """
+        Lazily apply an operation and yield the results in fixed-size chunks.
+
+        Args:
+            data: Any iterable or iterator of items
+            operation: One of STREAMING_OPERATIONS
+            chunk_size: Maximum number of items per chunk
+            **kwargs: Operation parameters, see stream()
+
+        Yields:
+            Lists of at most chunk_size transformed items
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        results = self.stream(data, operation, **kwargs)
+        while True:
+            chunk = list(islice(results, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
     def chain_operations(self, data: Any, operations: List[tuple]) -> Any:
         """
         Chain multiple operations together.
@@ -151,7 +576,76 @@ class TransformerPlugin(Plugin):
         Returns:
             Final transformed data
         """
-        result = data
-        for op_name, op_kwargs in operations:
-            result = self.execute(result, op_name, **op_kwargs)
-        return result
+        return self.compile_pipeline(operations)(data)
+
+    def compile_pipeline(self, operations: Sequence) -> TransformPipeline:
+        """
+        Compile a list of operations into a reusable pipeline.
+
+        Args:
+            operations: List of (operation_name, kwargs) tuples; a bare
+                operation name is accepted for steps without kwargs
+
+        Returns:
+            TransformPipeline: Pipeline that can be called with data
+
+        Raises:
+            ValueError: If an operation is unknown
+        """
+        stages = []
+        names = []
+        fused: List[Tuple[str, Callable]] = []
+
+        def flush_fused():
+            if fused:
+                stages.append(partial(self._run_fused, tuple(fused)))
+                names.append('+'.join(op for op, _ in fused))
+                fused.clear()
+
+        for step in operations:
+            if isinstance(step, str):
+                op_name, op_kwargs = step, {}
+            else:
+                op_name, op_kwargs = step
+                op_kwargs = op_kwargs or {}
+
+            # Steps with a per-step backend run on their own so it is honored
+            if (op_name in ELEMENTWISE_OPERATIONS and self._is_builtin(op_name)
+                    and 'backend' not in op_kwargs):
+                key = 'condition' if op_name == 'filter' else 'transform'
+                fused.append((op_name, op_kwargs.get(key)))
+                continue
+
+            flush_fused()
+            stages.append(self._resolve_operation(op_name, op_kwargs))
+            names.append(op_name)
+
+        flush_fused()
+        return TransformPipeline(stages, names)
+
+    def _is_builtin(self, operation: str) -> bool:
+        """Check whether a built-in operation has not been replaced"""
+        builtin = {'filter': self._filter_data, 'map': self._map_data}.get(operation)
+        return builtin is not None and self._operations.get(operation) == builtin
+
+    def _resolve_operation(self, operation: str, kwargs: Dict[str, Any]) -> Callable[[Any], Any]:
+        """Bind an operation and its kwargs to a single-argument callable"""
+        handler = self._operations.get(operation)
+        if handler is None:
+            raise ValueError(f"Unknown operation: {operation}")
+        return partial(handler, **kwargs) if kwargs else handler
+
+    def run_pipeline(self, name: str, data: Any) -> Any:
+        """
+        Run a pipeline pre-built from the 'transformations' config.
+
+        Args:
+            name: Pipeline name
+            data: Initial data
+
+        Returns:
+            Final transformed data
+        """
+        if name not in self.pipelines:
+            raise ValueError(f"Unknown pipeline: {name}")
+        return self.pipelines[name](data)
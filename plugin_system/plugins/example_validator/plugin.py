@@ -1,11 +1,136 @@
 """Data validator plugin implementation"""
 
 import re
-from typing import Any, Dict, List
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import partial
+from itertools import compress
+from typing import Any, Callable, Dict, Iterable, List, Optional, Pattern, Tuple, Union
 
 from plugin_system.core.plugin import Plugin, PluginMetadata
 
 
+# Maps valid flags (1) to 0 and invalid flags (0) to 1
+_INVERT = bytes.maketrans(b'\x00\x01', b'\x01\x00')
+
+
+# Rule values that are regex rules (re.compile returns a Pattern unchanged)
+_REGEX_RULE_TYPES = (str, re.Pattern)
+
+
+def _is_mergeable(pattern: Pattern) -> bool:
+    """
+    Check whether a pattern can be embedded in a merged pattern.
+
+    Merging renumbers groups and only carries the pattern text, so patterns
+    with groups reachable only by number, with flags, or over bytes are not.
+    """
+    return (isinstance(pattern.pattern, str)
+            and pattern.flags == re.UNICODE
+            and pattern.groups == len(pattern.groupindex))
+
+
+@dataclass
+class BulkValidationResult:
+    """Compact result of validating many values against one rule"""
+    rule_type: str
+    valid: bytearray
+    failures: List[int] = field(default_factory=list)
+
+    @property
+    def total(self) -> int:
+        """Number of validated values"""
+        return len(self.valid)
+
+    @property
+    def passed(self) -> int:
+        """Number of valid values"""
+        return len(self.valid) - len(self.failures)
+
+    @property
+    def all_valid(self) -> bool:
+        """Check if every value was valid"""
+        return not self.failures
+
+
+class ValidationCache:
+    """
+    Bounded LRU cache of rule match results keyed by (rule_type, value).
+
+    Entries optionally expire after a TTL. Hit, miss and eviction counters
+    are kept for monitoring. All operations hold a lock, so the cache can be
+    shared by threads executing the plugin concurrently.
+    """
+
+    def __init__(self, max_size: int, ttl: Optional[float] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of cached results
+            ttl: Optional lifetime of an entry in seconds
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Tuple[str, str]) -> Optional[bool]:
+        """Get a cached result, or None on a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            result, expires_at = entry
+            if expires_at is not None and expires_at < time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def put(self, key: Tuple[str, str], result: bool) -> None:
+        """Store a result, evicting the least recently used entry if full"""
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries[key] = (result, expires_at)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate_rule(self, rule_type: str) -> None:
+        """Drop all cached results of a rule"""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == rule_type]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all cached results"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Get cache counters"""
+        with self._lock:
+            return {
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
+
+
 class ValidatorPlugin(Plugin):
     """
     Example plugin that validates data against rules.
@@ -14,6 +139,16 @@ class ValidatorPlugin(Plugin):
     def __init__(self):
         super().__init__()
         self.validation_rules = {}
+        self._patterns: Dict[str, Pattern] = {}
+        self._combined: Dict[Tuple[str, ...], tuple] = {}
+        self._cache: Optional[ValidationCache] = None
+        self._operations: Dict[str, Callable[..., Dict[str, Any]]] = {
+            'email': self._validate_email,
+            'phone': self._validate_phone,
+            'url': self._validate_url,
+            'length': self._validate_length_rule,
+            'custom': self._validate_custom_rule,
+        }
 
     def get_metadata(self) -> PluginMetadata:
         return PluginMetadata(
@@ -29,6 +164,8 @@ class ValidatorPlugin(Plugin):
 
         Config options:
             - rules: Dictionary of validation rules
+            - cache_size: Number of cached regex results (default: 0, disabled)
+            - cache_ttl: Lifetime of cached results in seconds (default: None)
         """
         config = config or {}
 
@@ -39,9 +176,22 @@ class ValidatorPlugin(Plugin):
             'min_length': 3,
             'max_length': 100
         })
+        self._compile_rules()
+
+        cache_size = config.get('cache_size', 0)
+        self._cache = ValidationCache(cache_size, config.get('cache_ttl')) if cache_size > 0 else None
 
         return True
 
+    def _compile_rules(self) -> None:
+        """Precompile all regex rules (strings or already compiled patterns)"""
+        self._patterns = {
+            name: re.compile(rule)
+            for name, rule in self.validation_rules.items()
+            if isinstance(rule, _REGEX_RULE_TYPES)
+        }
+        self._combined = {}
+
     def execute(self, data: Any, rule_type: str, **kwargs) -> Dict[str, Any]:
         """
         Validate data against a rule.
@@ -54,46 +204,76 @@ class ValidatorPlugin(Plugin):
         Returns:
             dict: Validation result with 'valid' and 'message' keys
         """
-        if rule_type == 'email':
-            return self._validate_email(data)
-        elif rule_type == 'phone':
-            return self._validate_phone(data)
-        elif rule_type == 'url':
-            return self._validate_url(data)
-        elif rule_type == 'length':
-            min_len = kwargs.get('min', self.validation_rules.get('min_length', 0))
-            max_len = kwargs.get('max', self.validation_rules.get('max_length', float('inf')))
-            return self._validate_length(data, min_len, max_len)
-        elif rule_type == 'custom':
-            pattern = kwargs.get('pattern')
-            return self._validate_custom(data, pattern)
-        else:
+        handler = self._operations.get(rule_type)
+        if handler is None:
             return {
                 'valid': False,
                 'message': f"Unknown validation rule: {rule_type}"
             }
+        return handler(data, **kwargs)
+
+    def register_operation(self, rule_type: str,
+                           handler: Callable[..., Dict[str, Any]] = None) -> Any:
+        """
+        Register (or replace) a validation rule type.
+
+        Can be called directly or used as a decorator. The handler is called
+        as handler(data, **kwargs) and must return a dict with 'valid' and
+        'message' keys.
+
+        Args:
+            rule_type: Rule type name used with execute()
+            handler: Callable implementing the validation
+
+        Returns:
+            The handler, or a decorator when no handler is given
+        """
+        if handler is None:
+            return lambda func: self.register_operation(rule_type, func)
+        self._operations[rule_type] = handler
+        return handler
 
-    def _validate_email(self, email: str) -> Dict[str, Any]:
+    def list_operations(self) -> List[str]:
+        """List all registered rule types"""
+        return list(self._operations.keys())
+
+    def _validate_email(self, email: str, **kwargs) -> Dict[str, Any]:
         """Validate email address"""
-        pattern = self.validation_rules.get('email')
-        if re.match(pattern, str(email)):
+        if self._match_rule('email', str(email)):
             return {'valid': True, 'message': 'Valid email address'}
         return {'valid': False, 'message': 'Invalid email address format'}
 
-    def _validate_phone(self, phone: str) -> Dict[str, Any]:
+    def _validate_phone(self, phone: str, **kwargs) -> Dict[str, Any]:
         """Validate phone number"""
-        pattern = self.validation_rules.get('phone')
-        if re.match(pattern, str(phone)):
+        if self._match_rule('phone', str(phone)):
             return {'valid': True, 'message': 'Valid phone number'}
         return {'valid': False, 'message': 'Invalid phone number format'}
 
-    def _validate_url(self, url: str) -> Dict[str, Any]:
+    def _validate_url(self, url: str, **kwargs) -> Dict[str, Any]:
         """Validate URL"""
-        pattern = self.validation_rules.get('url')
-        if re.match(pattern, str(url)):
+        if self._match_rule('url', str(url)):
             return {'valid': True, 'message': 'Valid URL'}
         return {'valid': False, 'message': 'Invalid URL format'}
 
+    def _match_rule(self, rule_type: str, value: str) -> bool:
+        """Match a value against a regex rule, using the result cache if enabled"""
+        cache = self._cache
+        if cache is None:
+            return self._patterns[rule_type].match(value) is not None
+
+        key = (rule_type, value)
+        result = cache.get(key)
+        if result is None:
+            result = self._patterns[rule_type].match(value) is not None
+            cache.put(key, result)
+        return result
+
+    def _validate_length_rule(self, data: str, **kwargs) -> Dict[str, Any]:
+        """Validate string length using 'min'/'max' kwargs or the configured limits"""
+        min_len = kwargs.get('min', self.validation_rules.get('min_length', 0))
+        max_len = kwargs.get('max', self.validation_rules.get('max_length', float('inf')))
+        return self._validate_length(data, min_len, max_len)
+
     def _validate_length(self, data: str, min_len: int, max_len: int) -> Dict[str, Any]:
         """Validate string length"""
         length = len(str(data))
@@ -104,6 +284,10 @@ class ValidatorPlugin(Plugin):
             'message': f'Length {length} must be between {min_len} and {max_len}'
         }
 
+    def _validate_custom_rule(self, data: str, pattern: str = None, **kwargs) -> Dict[str, Any]:
+        """Validate against the regex given in the 'pattern' kwarg"""
+        return self._validate_custom(data, pattern)
+
     def _validate_custom(self, data: str, pattern: str) -> Dict[str, Any]:
         """Validate against custom regex pattern"""
         if not pattern:
@@ -113,6 +297,139 @@ class ValidatorPlugin(Plugin):
             return {'valid': True, 'message': 'Matches custom pattern'}
         return {'valid': False, 'message': 'Does not match custom pattern'}
 
-    def add_rule(self, rule_name: str, pattern: str) -> None:
-        """Add a custom validation rule"""
+    def validate_bulk(self, values: Iterable[Any], rule_type: str, **kwargs) -> BulkValidationResult:
+        """
+        Validate many values against one rule without building a dict per value.
+
+        Supports every regex rule (email, phone, url and rules added with
+        add_rule) as well as 'length'. The valid flags are a bytearray with one
+        0/1 byte per value, so they can be wrapped without copying, e.g. with
+        numpy.frombuffer(result.valid, dtype=bool).
+
+        Args:
+            values: List, array or iterator of values to validate
+            rule_type: Name of the rule to apply
+            **kwargs: 'min'/'max' for the length rule
+
+        Returns:
+            BulkValidationResult: Valid flags and indices of failing values
+
+        Raises:
+            ValueError: If the rule is unknown
+        """
+        if rule_type == 'length':
+            min_len = kwargs.get('min', self.validation_rules.get('min_length', 0))
+            max_len = kwargs.get('max', self.validation_rules.get('max_length', float('inf')))
+            valid = bytearray(min_len <= len(str(value)) <= max_len for value in values)
+        else:
+            pattern = self._patterns.get(rule_type)
+            if pattern is None:
+                raise ValueError(f"Unknown validation rule: {rule_type}")
+            if self._cache is not None:
+                valid = bytearray(map(partial(self._match_rule, rule_type), map(str, values)))
+            else:
+                valid = bytearray(map(bool, map(pattern.match, map(str, values))))
+
+        failures = list(compress(range(len(valid)), valid.translate(_INVERT)))
+        return BulkValidationResult(rule_type=rule_type, valid=valid, failures=failures)
+
+    def validate_rules(self, data: Any, rule_types: Iterable[str], **kwargs) -> Dict[str, bool]:
+        """
+        Validate one value against several rules in a single pass.
+
+        All regex rules are merged into one pattern of optional lookaheads with
+        a named group per rule, so a single match call reports every rule the
+        value satisfies. The merged pattern is cached per rule set.
+
+        Args:
+            data: Value to validate
+            rule_types: Rules to check (regex rules and 'length')
+            **kwargs: 'min'/'max' for the length rule
+
+        Returns:
+            dict: Mapping of rule name to whether the value matched it
+
+        Raises:
+            ValueError: If a rule is unknown
+        """
+        if not isinstance(rule_types, tuple):
+            rule_types = tuple(rule_types)
+
+        plan = self._combined.get(rule_types)
+        if plan is None:
+            plan = self._build_rule_plan(rule_types)
+
+        combined, combined_rules, groups, separate, check_length = plan
+        value = str(data)
+        results = {}
+
+        if combined is not None:
+            matched = combined.match(value).group(*groups)
+            for rule, group in zip(combined_rules, matched):
+                results[rule] = group is not None
+
+        for rule in separate:
+            results[rule] = self._patterns[rule].match(value) is not None
+
+        if check_length:
+            min_len = kwargs.get('min', self.validation_rules.get('min_length', 0))
+            max_len = kwargs.get('max', self.validation_rules.get('max_length', float('inf')))
+            results['length'] = min_len <= len(value) <= max_len
+
+        return results
+
+    def _build_rule_plan(self, rule_types: Tuple[str, ...]) -> tuple:
+        """
+        Build and cache the merged pattern for a set of rules.
+
+        Rules with numbered groups or flags, or rule sets whose patterns cannot
+        be merged, are matched separately: merging renumbers the groups, which
+        breaks backreferences (\\1) and conditionals (?(1)...) to them, and
+        drops flags of precompiled patterns.
+
+        Returns:
+            tuple: (merged pattern or None, rules in the merged pattern,
+                their group indices, rules matched separately, check length)
+        """
+        regex_rules = tuple(rule for rule in rule_types if rule != 'length')
+        for rule in regex_rules:
+            if rule not in self._patterns:
+                raise ValueError(f"Unknown validation rule: {rule}")
+
+        combined_rules = tuple(rule for rule in regex_rules
+                               if _is_mergeable(self._patterns[rule]))
+
+        combined = None
+        if len(combined_rules) > 1:
+            try:
+                combined = re.compile(''.join(
+                    f"(?=(?P<r{index}>{self._patterns[rule].pattern}))?"
+                    for index, rule in enumerate(combined_rules)
+                ))
+            except re.error:
+                combined = None
+
+        if combined is None:
+            combined_rules = ()
+        groups = tuple(combined.groupindex[f"r{index}"] for index in range(len(combined_rules)))
+        separate = tuple(rule for rule in regex_rules if rule not in combined_rules)
+
+        plan = (combined, combined_rules, groups, separate, 'length' in rule_types)
+        self._combined[rule_types] = plan
+        return plan
+
+    def add_rule(self, rule_name: str, pattern: Union[str, Pattern]) -> None:
+        """Add a custom validation rule from a regex string or compiled pattern"""
+        compiled = re.compile(pattern) if isinstance(pattern, _REGEX_RULE_TYPES) else None
         self.validation_rules[rule_name] = pattern
+        if compiled is not None:
+            self._patterns[rule_name] = compiled
+        else:
+            self._patterns.pop(rule_name, None)
+        self._combined = {}
+        if self._cache is not None:
+            self._cache.invalidate_rule(rule_name)
+
+    def cache_stats(self) -> Optional[Dict[str, int]]:
+        """Get result cache counters, or None if caching is disabled"""
+        return self._cache.stats() if self._cache is not None else None